@@ -11,7 +11,7 @@ import logging
 from pathlib import Path
 
 from src.auth import AccountManager
-from src.config.settings import Settings
+from src.config.settings import load_config
 
 # Configure logging
 logging.basicConfig(
@@ -23,7 +23,7 @@ app = Flask(__name__)
 app.secret_key = secrets.token_hex(32)
 
 # Load configuration
-config = Settings()
+config = load_config()
 
 # Initialize account manager
 account_manager = AccountManager()
@@ -1,6 +1,6 @@
 """Player character class and management."""
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 from .stats import CoreAttributes, DerivedStats, StatCalculator
@@ -10,6 +10,26 @@ from .progression import ExperienceSystem, AbilitySystem, LevelUpManager
 class PlayerCharacter:
     """Represents the player's character."""
 
+    __slots__ = (
+        'username',
+        'character_name',
+        'display_name',
+        'path',
+        'attributes',
+        'level',
+        'xp',
+        'derived_stats',
+        'unspent_stat_points',
+        'abilities',
+        'inventory',
+        'equipped',
+        'location',
+        'gold',
+        'created_at',
+        'last_played',
+        '_attribute_display'
+    )
+
     def __init__(
         self,
         username: str,
@@ -32,6 +52,7 @@ class PlayerCharacter:
         """
         self.username = username
         self.character_name = character_name
+        self.display_name = character_name.title()
         self.path = path.lower()
 
         # Core stats
@@ -41,6 +62,7 @@ class PlayerCharacter:
 
         # Derived stats
         self.derived_stats = StatCalculator.calculate_all_derived_stats(self.attributes, self.level)
+        self._attribute_display: Optional[Tuple[Tuple[str, int], ...]] = None
 
         # Progression
         self.unspent_stat_points = 0
@@ -59,8 +81,9 @@ class PlayerCharacter:
         self.gold = 0
 
         # Timestamps
-        self.created_at = datetime.utcnow().isoformat()
-        self.last_played = datetime.utcnow().isoformat()
+        now = datetime.utcnow().isoformat()
+        self.created_at = now
+        self.last_played = now
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PlayerCharacter':
@@ -228,6 +251,8 @@ class PlayerCharacter:
 
     def _recalculate_derived_stats(self):
         """Recalculate all derived stats from current attributes and level."""
+        self._attribute_display = None
+
         # Store current values as percentages
         health_pct = self.derived_stats.current_health / self.derived_stats.max_health if self.derived_stats.max_health > 0 else 1.0
         mana_pct = self.derived_stats.current_mana / self.derived_stats.max_mana if self.derived_stats.max_mana > 0 else 1.0
@@ -360,6 +385,27 @@ class PlayerCharacter:
             'percentage': percentage
         }
 
+    def get_attribute_display(self) -> Tuple[Tuple[str, int], ...]:
+        """
+        Get core attributes as (label, value) display rows.
+
+        Built on first use and reused until attributes or level change.
+
+        Returns:
+            Tuple of (label, attribute value) pairs
+        """
+        if self._attribute_display is None:
+            attributes = self.attributes
+            self._attribute_display = (
+                ("Strength", attributes.strength),
+                ("Constitution", attributes.constitution),
+                ("Agility", attributes.agility),
+                ("Intelligence", attributes.intelligence),
+                ("Willpower", attributes.willpower),
+                ("Charisma", attributes.charisma),
+            )
+        return self._attribute_display
+
     def get_combat_stats(self) -> Dict[str, int]:
         """
         Get combat-relevant stats.
@@ -2,6 +2,7 @@
 
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+import bisect
 import math
 
 
@@ -76,14 +77,8 @@ class ExperienceSystem:
         Returns:
             Character level
         """
-        level = 1
-        while level < ExperienceSystem.MAX_LEVEL:
-            xp_for_next = ExperienceSystem.calculate_xp_for_level(level + 1)
-            if total_xp < xp_for_next:
-                break
-            level += 1
-
-        return level
+        # One level per threshold already reached (thresholds are ascending)
+        return 1 + bisect.bisect_right(_LEVEL_XP_THRESHOLDS, total_xp)
 
     @staticmethod
     def get_progress_to_next_level(total_xp: int, current_level: int) -> Tuple[int, int]:
@@ -225,6 +220,13 @@ class AbilitySystem:
         return None
 
 
+# Total XP required for levels 2..MAX_LEVEL, computed once for get_level_from_xp
+_LEVEL_XP_THRESHOLDS: Tuple[int, ...] = tuple(
+    ExperienceSystem.calculate_xp_for_level(level)
+    for level in range(2, ExperienceSystem.MAX_LEVEL + 1)
+)
+
+
 class LevelUpManager:
     """Manages level up process and rewards."""
 
@@ -29,13 +29,14 @@ class CoreAttributes:
     @classmethod
     def from_dict(cls, data: Dict[str, int]) -> 'CoreAttributes':
         """Create from dictionary."""
+        get = data.get
         return cls(
-            strength=data.get('strength', 10),
-            constitution=data.get('constitution', 10),
-            agility=data.get('agility', 10),
-            intelligence=data.get('intelligence', 10),
-            willpower=data.get('willpower', 10),
-            charisma=data.get('charisma', 10)
+            strength=get('strength', 10),
+            constitution=get('constitution', 10),
+            agility=get('agility', 10),
+            intelligence=get('intelligence', 10),
+            willpower=get('willpower', 10),
+            charisma=get('charisma', 10)
         )
 
     def get_total(self) -> int:
@@ -10,10 +10,8 @@ from .effects import (
     create_poison,
     create_stun,
     create_shield,
-    create_strength_buff,
-    create_agility_buff,
-    create_weakness,
-    create_slow
+    create_strengthen,
+    create_regeneration
 )
 from .actions import (
     CombatAction,
@@ -48,10 +46,8 @@ __all__ = [
     'create_poison',
     'create_stun',
     'create_shield',
-    'create_strength_buff',
-    'create_agility_buff',
-    'create_weakness',
-    'create_slow',
+    'create_strengthen',
+    'create_regeneration',
 
     # Actions
     'CombatAction',
@@ -64,6 +64,9 @@ class Battle:
         # Initialize enemy AI
         self.enemy_ais = [EnemyAI(enemy) for enemy in enemies]
 
+        # Indices of enemies still standing; rebuilt (not mutated) as enemies fall
+        self.live_enemy_indices: List[int] = [i for i, enemy in enumerate(enemies) if enemy.is_alive()]
+
         # Combat state
         self.player_defending = False
 
@@ -119,9 +122,10 @@ class Battle:
 
         # Execute action
         result = self._execute_player_action(action, target)
+        self._prune_dead_enemies()
 
         # Check for victory
-        if all(not enemy.is_alive() for enemy in self.enemies):
+        if not self.live_enemy_indices:
             self.result = BattleResult.VICTORY
             result['battle_result'] = BattleResult.VICTORY
             result['rewards'] = self._calculate_rewards()
@@ -297,6 +301,7 @@ class Battle:
 
         if effect_damage > 0:
             enemy.take_damage(effect_damage)
+            self._prune_dead_enemies()
 
         # Check if incapacitated
         if enemy.effect_manager.is_incapacitated():
@@ -334,7 +339,9 @@ class Battle:
             Flee attempt result
         """
         # Calculate average enemy agility
-        avg_enemy_agi = sum(e.attributes.agility for e in self.enemies if e.is_alive()) / len([e for e in self.enemies if e.is_alive()])
+        enemies = self.enemies
+        live = self.live_enemy_indices
+        avg_enemy_agi = sum(enemies[i].attributes.agility for i in live) / len(live)
 
         flee_chance = DamageCalculator.calculate_flee_chance(
             self.player.attributes.agility,
@@ -354,6 +361,14 @@ class Battle:
                 'message': "Failed to escape! The enemies block your path!"
             }
 
+    def _prune_dead_enemies(self):
+        """Drop defeated enemies from live_enemy_indices."""
+        # Inlined Enemy.is_alive(): this runs after every action
+        enemies = self.enemies
+        self.live_enemy_indices = [
+            i for i in self.live_enemy_indices if enemies[i].derived_stats.current_health > 0
+        ]
+
     def _calculate_rewards(self) -> Dict[str, Any]:
         """Calculate rewards for victory."""
         total_xp = sum(enemy.xp_reward for enemy in self.enemies)
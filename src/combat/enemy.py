@@ -1,16 +1,53 @@
 """Enemy classes and AI behavior."""
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence, Tuple
+import copy
+import functools
 import random
 
 from ..character.stats import CoreAttributes, DerivedStats, StatCalculator
 from .effects import EffectManager, StatusEffect
 from .damage import DamageCalculator, AttackType
 
+# Bound methods of the module-level generator: skips the attribute lookup
+# on every roll while still honouring random.seed() for reproducibility
+_uniform = random.random
+_randrange = random.randrange
+
+
+@functools.lru_cache(maxsize=512)
+def _calc_derived_stats(attr_tuple: Tuple[int, ...], level: int) -> DerivedStats:
+    """
+    Calculate derived stats for an attribute set, memoized per template.
+
+    The cached object is shared; callers must copy it before mutating.
+
+    Args:
+        attr_tuple: Core attribute values in CoreAttributes field order
+        level: Enemy level
+
+    Returns:
+        DerivedStats object
+    """
+    return StatCalculator.calculate_all_derived_stats(CoreAttributes(*attr_tuple), level)
+
 
 class Enemy:
     """Represents an enemy combatant."""
 
+    __slots__ = (
+        'name',
+        'level',
+        'attributes',
+        'base_damage',
+        'abilities',
+        'derived_stats',
+        'xp_reward',
+        'gold_reward',
+        'effect_manager',
+        'is_defending'
+    )
+
     def __init__(
         self,
         name: str,
@@ -39,8 +76,16 @@ class Enemy:
         self.base_damage = base_damage
         self.abilities = abilities or []
 
-        # Calculate derived stats
-        self.derived_stats = StatCalculator.calculate_all_derived_stats(attributes, level)
+        # Calculate derived stats (copied, since current values change per instance)
+        attr_tuple = (
+            attributes.strength,
+            attributes.constitution,
+            attributes.agility,
+            attributes.intelligence,
+            attributes.willpower,
+            attributes.charisma
+        )
+        self.derived_stats = copy.copy(_calc_derived_stats(attr_tuple, level))
 
         # Rewards
         self.xp_reward = xp_reward if xp_reward is not None else 50 * level
@@ -110,9 +155,65 @@ class Enemy:
         }
 
 
+class AliasTable:
+    """Walker/Vose alias table for O(1) weighted sampling."""
+
+    def __init__(self, weights: Sequence[float]):
+        """
+        Build the alias table.
+
+        Args:
+            weights: Non-negative relative weights (at least one positive)
+        """
+        n = len(weights)
+        total = float(sum(weights))
+        if n == 0 or total <= 0:
+            raise ValueError("AliasTable requires at least one positive weight")
+
+        self.prob: List[float] = [0.0] * n
+        self.alias: List[int] = [0] * n
+
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # Remaining buckets are full (up to floating point error)
+        for i in large + small:
+            self.prob[i] = 1.0
+            self.alias[i] = i
+
+    def sample(self) -> int:
+        """
+        Draw a weighted index.
+
+        Returns:
+            Index into the original weights
+        """
+        i = _randrange(len(self.prob))
+        return i if _uniform() < self.prob[i] else self.alias[i]
+
+
 class EnemyAI:
     """AI behavior for enemies."""
 
+    __slots__ = ('enemy', 'aggression')
+
+    # Outcomes of the special-ability roll and their relative weights
+    SPECIAL_CHOICES = ("special", "attack")
+    SPECIAL_WEIGHTS = (1, 2)  # Weighted toward attack
+    _SPECIAL_ALIAS = AliasTable(SPECIAL_WEIGHTS)
+
     def __init__(self, enemy: Enemy):
         """
         Initialize enemy AI.
@@ -145,17 +246,17 @@ class EnemyAI:
 
         # Low health defensive behavior
         if enemy_health_percent < 0.3:
-            if random.random() < 0.4:  # 40% chance to defend when low
+            if _uniform() < 0.4:  # 40% chance to defend when low
                 return "defend"
 
         # Check for special abilities
-        if self.enemy.abilities and random.random() < 0.3:  # 30% chance to use special
-            return random.choice(["special"] + ["attack", "attack"])  # Weighted toward attack
+        if self.enemy.abilities and _uniform() < 0.3:  # 30% chance to use special
+            return self.SPECIAL_CHOICES[self._SPECIAL_ALIAS.sample()]
 
         # Normal behavior based on aggression
-        if random.random() < self.aggression:
+        if _uniform() < self.aggression:
             # Choose attack type
-            attack_roll = random.random()
+            attack_roll = _uniform()
             if attack_roll < 0.1:
                 return "heavy_attack"
             elif attack_roll < 0.3:
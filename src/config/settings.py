@@ -6,6 +6,8 @@ from typing import Any
 
 import yaml
 
+from ..utils.yaml_loader import YamlLoader
+
 
 # Base paths
 BASE_DIR = Path(__file__).parent.parent.parent
@@ -13,23 +15,31 @@ DATA_DIR = BASE_DIR / "data"
 CONFIG_DIR = BASE_DIR / "config"
 
 
+def _flatten(data: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    """Flatten nested dicts into dotted keys, keeping intermediate levels."""
+    flat: dict[str, Any] = {}
+    for k, v in data.items():
+        key = f"{prefix}{k}"
+        flat[key] = v
+        if isinstance(v, dict):
+            flat.update(_flatten(v, f"{key}."))
+    return flat
+
+
 class Config:
     """Game configuration container."""
 
+    __slots__ = ('_data', '_flat')
+
     def __init__(self, data: dict[str, Any] | None = None):
         self._data = data or {}
+        self._flat = _flatten(self._data)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
-        keys = key.split(".")
-        value = self._data
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
-            if value is None:
-                return default
+        value = self._flat.get(key)
+        if value is None:
+            return default
         return value
 
     @property
@@ -60,7 +70,7 @@ def load_config(config_path: Path | None = None) -> Config:
 
     if config_path.exists():
         with open(config_path, "r") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=YamlLoader) or {}
     else:
         data = get_default_config()
 
@@ -1,11 +1,16 @@
 """Data loading utilities for game content."""
 
 import json
+import os
+import threading
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 import logging
 
+from ..utils.yaml_loader import YamlLoader
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +26,7 @@ class DataLoader:
         """
         self.data_dir = Path(data_dir)
         self._cache: Dict[str, Any] = {}
+        self._cache_lock = threading.Lock()
         self.use_cache = True
 
     def load_json(self, file_path: Union[str, Path], use_cache: bool = True) -> Optional[Dict]:
@@ -44,12 +50,12 @@ class DataLoader:
         # Check cache
         cache_key = str(path)
         if use_cache and self.use_cache and cache_key in self._cache:
-            logger.debug(f"Loading from cache: {path}")
+            logger.debug("Loading from cache: %s", path)
             return self._cache[cache_key]
 
         # Check if file exists
         if not path.exists():
-            logger.warning(f"File not found: {path}")
+            logger.warning("File not found: %s", path)
             return None
 
         try:
@@ -58,16 +64,17 @@ class DataLoader:
 
             # Cache the data
             if self.use_cache:
-                self._cache[cache_key] = data
+                with self._cache_lock:
+                    self._cache[cache_key] = data
 
-            logger.debug(f"Loaded JSON: {path}")
+            logger.debug("Loaded JSON: %s", path)
             return data
 
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in {path}: {e}")
+            logger.error("Invalid JSON in %s: %s", path, e)
             return None
         except Exception as e:
-            logger.error(f"Error loading {path}: {e}")
+            logger.error("Error loading %s: %s", path, e)
             return None
 
     def load_yaml(self, file_path: Union[str, Path], use_cache: bool = True) -> Optional[Dict]:
@@ -91,30 +98,31 @@ class DataLoader:
         # Check cache
         cache_key = str(path)
         if use_cache and self.use_cache and cache_key in self._cache:
-            logger.debug(f"Loading from cache: {path}")
+            logger.debug("Loading from cache: %s", path)
             return self._cache[cache_key]
 
         # Check if file exists
         if not path.exists():
-            logger.warning(f"File not found: {path}")
+            logger.warning("File not found: %s", path)
             return None
 
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=YamlLoader)
 
             # Cache the data
             if self.use_cache:
-                self._cache[cache_key] = data
+                with self._cache_lock:
+                    self._cache[cache_key] = data
 
-            logger.debug(f"Loaded YAML: {path}")
+            logger.debug("Loaded YAML: %s", path)
             return data
 
         except yaml.YAMLError as e:
-            logger.error(f"Invalid YAML in {path}: {e}")
+            logger.error("Invalid YAML in %s: %s", path, e)
             return None
         except Exception as e:
-            logger.error(f"Error loading {path}: {e}")
+            logger.error("Error loading %s: %s", path, e)
             return None
 
     def load_character(self, character_name: str) -> Optional[Dict]:
@@ -194,7 +202,8 @@ class DataLoader:
 
     def clear_cache(self) -> None:
         """Clear the data cache."""
-        self._cache.clear()
+        with self._cache_lock:
+            self._cache.clear()
         logger.debug("Data cache cleared")
 
     def invalidate(self, file_path: Union[str, Path]) -> None:
@@ -209,23 +218,37 @@ class DataLoader:
             path = self.data_dir / path
 
         cache_key = str(path)
-        if cache_key in self._cache:
-            del self._cache[cache_key]
-            logger.debug(f"Invalidated cache for: {path}")
+        with self._cache_lock:
+            removed = self._cache.pop(cache_key, None) is not None
+        if removed:
+            logger.debug("Invalidated cache for: %s", path)
 
     def preload(self, file_paths: list) -> None:
         """
         Preload multiple files into cache.
 
+        Files are read and parsed concurrently, since loading is dominated
+        by disk I/O.
+
         Args:
             file_paths: List of file paths to preload
         """
+        loaders = []
         for file_path in file_paths:
-            path = Path(file_path)
-            if path.suffix in ['.json', '.JSON']:
-                self.load_json(file_path)
-            elif path.suffix in ['.yaml', '.yml', '.YAML', '.YML']:
-                self.load_yaml(file_path)
+            suffix = Path(file_path).suffix.lower()
+            if suffix == '.json':
+                loaders.append((self.load_json, file_path))
+            elif suffix in ('.yaml', '.yml'):
+                loaders.append((self.load_yaml, file_path))
+
+        if not loaders:
+            return
+
+        max_workers = min(8, os.cpu_count() or 1, len(loaders))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(loader, file_path) for loader, file_path in loaders]
+            for future in futures:
+                future.result()
 
     def get_cache_stats(self) -> Dict[str, int]:
         """
@@ -210,14 +210,15 @@ class DataValidator:
         all_valid_fields = required_fields | optional_fields
 
         # Check for missing required fields
-        missing = required_fields - set(data.keys())
+        missing = required_fields.difference(data)
         if missing:
             raise ValidationError(f"{data_type} missing required fields: {missing}")
 
-        # Check for unknown fields
-        unknown = set(data.keys()) - all_valid_fields
-        if unknown:
-            logger.warning(f"{data_type} has unknown fields: {unknown}")
+        # Check for unknown fields (only worth computing if it will be logged)
+        if logger.isEnabledFor(logging.WARNING):
+            unknown = data.keys() - all_valid_fields
+            if unknown:
+                logger.warning("%s has unknown fields: %s", data_type, unknown)
 
     def validate_batch(self, data_items: List[Dict], validator_func: callable) -> Dict[str, List[str]]:
         """
@@ -3,7 +3,7 @@
 from .state_machine import StateMachine, GameState
 from .output import OutputFormatter, Color, Style
 from .input_handler import InputHandler, ParsedCommand
-from .commands import CommandRegistry, CommandDefinition, CommandCategory
+from .commands import CommandRegistry, CommandDefinition, CommandCategory, get_registry
 from .game_loop import GameLoop
 
 __all__ = [
@@ -17,5 +17,6 @@ __all__ = [
     'CommandRegistry',
     'CommandDefinition',
     'CommandCategory',
+    'get_registry',
     'GameLoop'
 ]
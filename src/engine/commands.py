@@ -1,7 +1,11 @@
 """Command definitions and registry."""
 
-from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, TYPE_CHECKING
+import bisect
+import functools
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 from enum import Enum
 
 if TYPE_CHECKING:
@@ -18,268 +22,430 @@ class CommandCategory(Enum):
     SYSTEM = "System"
 
 
-@dataclass
+# Category display order, fixed once so help rendering iterates a plain tuple
+_CATEGORIES_ORDERED: Tuple[CommandCategory, ...] = tuple(CommandCategory)
+_CATEGORY_HEADERS: Dict[CommandCategory, str] = {
+    category: f"{category.value}:" for category in _CATEGORIES_ORDERED
+}
+
+
+@dataclass(frozen=True, slots=True)
 class CommandDefinition:
     """Definition of a game command."""
     name: str
     description: str
     category: CommandCategory
-    aliases: List[str]
+    aliases: Tuple[str, ...]
     usage: str
-    examples: List[str]
+    examples: Tuple[str, ...]
     requires_target: bool = False
 
-    def matches(self, action: str) -> bool:
-        """
-        Check if action matches this command.
+    # Pre-rendered help text
+    _help_line: str = field(init=False, repr=False, compare=False)
+    _help_detail: str = field(init=False, repr=False, compare=False)
 
-        Args:
-            action: Action string to check
+    def __post_init__(self):
+        """Normalize sequences to tuples and precompute help text."""
+        # Frozen dataclass: assign through object.__setattr__
+        object.__setattr__(self, 'aliases', tuple(self.aliases))
+        object.__setattr__(self, 'examples', tuple(self.examples))
 
-        Returns:
-            True if action matches command name or aliases
-        """
-        action_lower = action.lower()
-        return action_lower == self.name or action_lower in self.aliases
+        alias_text = f" ({', '.join(self.aliases)})" if self.aliases else ""
+        object.__setattr__(self, '_help_line', f"  {self.name}{alias_text} - {self.description}")
+        object.__setattr__(self, '_help_detail', self._render_help_detail())
 
+    def _render_help_detail(self) -> str:
+        """Render the detailed help block for this command."""
+        lines = [
+            f"Command: {self.name}",
+            f"Description: {self.description}",
+            f"Usage: {self.usage}",
+            f"Category: {self.category.value}",
+        ]
 
-class CommandRegistry:
-    """Registry of all available commands."""
+        if self.aliases:
+            lines.append(f"Aliases: {', '.join(self.aliases)}")
 
-    def __init__(self):
-        """Initialize command registry."""
-        self.commands: Dict[str, CommandDefinition] = {}
-        self._register_default_commands()
+        if self.examples:
+            lines.append("Examples:")
+            for example in self.examples:
+                lines.append(f"  - {example}")
+
+        return "\n".join(lines)
 
-    def _register_default_commands(self):
-        """Register all default game commands."""
 
+@functools.cache
+def _default_commands() -> Tuple[CommandDefinition, ...]:
+    """Build the built-in command definitions, once, on first registry creation."""
+    return (
         # Movement commands
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="move",
             description="Move in a direction",
             category=CommandCategory.MOVEMENT,
-            aliases=["go", "walk", "run", "travel"],
+            aliases=("go", "walk", "run", "travel"),
             usage="move <direction>",
-            examples=["move north", "go east", "n", "south"],
+            examples=("move north", "go east", "n", "south"),
             requires_target=False
-        ))
+        ),
 
         # Examination commands
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="look",
             description="Look at your surroundings or examine an object",
             category=CommandCategory.INTERACTION,
-            aliases=["l", "examine", "inspect", "check"],
+            aliases=("l", "examine", "inspect", "check"),
             usage="look [target]",
-            examples=["look", "look sword", "examine door", "l"],
+            examples=("look", "look sword", "examine door", "l"),
             requires_target=False
-        ))
+        ),
 
         # Inventory commands
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="inventory",
             description="View your inventory",
             category=CommandCategory.INVENTORY,
-            aliases=["i", "inv", "items"],
+            aliases=("i", "inv", "items"),
             usage="inventory",
-            examples=["inventory", "i", "inv"],
+            examples=("inventory", "i", "inv"),
             requires_target=False
-        ))
+        ),
 
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="take",
             description="Pick up an item",
             category=CommandCategory.INVENTORY,
-            aliases=["get", "grab", "pick", "pickup"],
+            aliases=("get", "grab", "pick", "pickup"),
             usage="take <item>",
-            examples=["take sword", "get potion", "pickup key"],
+            examples=("take sword", "get potion", "pickup key"),
             requires_target=True
-        ))
+        ),
 
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="drop",
             description="Drop an item from inventory",
             category=CommandCategory.INVENTORY,
-            aliases=["discard", "throw"],
+            aliases=("discard", "throw"),
             usage="drop <item>",
-            examples=["drop sword", "discard torch"],
+            examples=("drop sword", "discard torch"),
             requires_target=True
-        ))
+        ),
 
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="use",
             description="Use an item",
             category=CommandCategory.INVENTORY,
-            aliases=["consume", "drink", "eat", "apply"],
+            aliases=("consume", "drink", "eat", "apply"),
             usage="use <item> [on target]",
-            examples=["use potion", "use key on door", "eat bread"],
+            examples=("use potion", "use key on door", "eat bread"),
             requires_target=True
-        ))
+        ),
 
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="equip",
             description="Equip a weapon or armor",
             category=CommandCategory.INVENTORY,
-            aliases=["wear", "wield"],
+            aliases=("wear", "wield"),
             usage="equip <item>",
-            examples=["equip sword", "wear armor", "wield staff"],
+            examples=("equip sword", "wear armor", "wield staff"),
             requires_target=True
-        ))
+        ),
 
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="unequip",
             description="Unequip a weapon or armor",
             category=CommandCategory.INVENTORY,
-            aliases=["remove", "unwield"],
+            aliases=("remove", "unwield"),
             usage="unequip <item>",
-            examples=["unequip sword", "remove armor"],
+            examples=("unequip sword", "remove armor"),
             requires_target=True
-        ))
+        ),
 
         # Combat commands
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="attack",
             description="Attack an enemy",
             category=CommandCategory.COMBAT,
-            aliases=["fight", "hit", "strike", "kill"],
+            aliases=("fight", "hit", "strike", "kill"),
             usage="attack <target>",
-            examples=["attack orc", "fight troll", "strike goblin"],
+            examples=("attack orc", "fight troll", "strike goblin"),
             requires_target=True
-        ))
+        ),
 
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="defend",
             description="Take a defensive stance",
             category=CommandCategory.COMBAT,
-            aliases=["block", "guard", "parry"],
+            aliases=("block", "guard", "parry"),
             usage="defend",
-            examples=["defend", "block", "guard"],
+            examples=("defend", "block", "guard"),
             requires_target=False
-        ))
+        ),
 
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="flee",
             description="Attempt to escape from combat",
             category=CommandCategory.COMBAT,
-            aliases=["escape", "run away"],
+            aliases=("escape", "run away"),
             usage="flee [direction]",
-            examples=["flee", "flee north", "escape"],
+            examples=("flee", "flee north", "escape"),
             requires_target=False
-        ))
+        ),
 
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="cast",
             description="Cast a spell (Pug path)",
             category=CommandCategory.COMBAT,
-            aliases=["spell"],
+            aliases=("spell",),
             usage="cast <spell> [on target]",
-            examples=["cast fireball on orc", "cast heal", "spell shield"],
+            examples=("cast fireball on orc", "cast heal", "spell shield"),
             requires_target=True
-        ))
+        ),
 
         # Interaction commands
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="talk",
             description="Talk to an NPC",
             category=CommandCategory.INTERACTION,
-            aliases=["speak", "chat", "converse"],
+            aliases=("speak", "chat", "converse"),
             usage="talk to <npc>",
-            examples=["talk to merchant", "speak with guard", "chat"],
+            examples=("talk to merchant", "speak with guard", "chat"),
             requires_target=False
-        ))
+        ),
 
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="open",
             description="Open a door or container",
             category=CommandCategory.INTERACTION,
-            aliases=["unlock"],
+            aliases=("unlock",),
             usage="open <object>",
-            examples=["open door", "open chest"],
+            examples=("open door", "open chest"),
             requires_target=True
-        ))
+        ),
 
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="close",
             description="Close a door or container",
             category=CommandCategory.INTERACTION,
-            aliases=["shut"],
+            aliases=("shut",),
             usage="close <object>",
-            examples=["close door", "shut chest"],
+            examples=("close door", "shut chest"),
             requires_target=True
-        ))
+        ),
 
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="rest",
             description="Rest to recover health and stamina",
             category=CommandCategory.INTERACTION,
-            aliases=["sleep", "camp"],
+            aliases=("sleep", "camp"),
             usage="rest",
-            examples=["rest", "sleep", "camp"],
+            examples=("rest", "sleep", "camp"),
             requires_target=False
-        ))
+        ),
 
         # Information commands
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="stats",
             description="View your character stats",
             category=CommandCategory.INFO,
-            aliases=["status", "character", "char"],
+            aliases=("status", "character", "char"),
             usage="stats",
-            examples=["stats", "status", "character"],
+            examples=("stats", "status", "character"),
             requires_target=False
-        ))
+        ),
 
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="help",
             description="Display help information",
             category=CommandCategory.SYSTEM,
-            aliases=["h", "?", "commands"],
+            aliases=("h", "?", "commands"),
             usage="help [command]",
-            examples=["help", "help attack", "commands"],
+            examples=("help", "help attack", "commands"),
             requires_target=False
-        ))
+        ),
 
         # System commands
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="save",
             description="Save your game",
             category=CommandCategory.SYSTEM,
-            aliases=[],
+            aliases=(),
             usage="save",
-            examples=["save"],
+            examples=("save",),
             requires_target=False
-        ))
+        ),
 
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="load",
             description="Load a saved game",
             category=CommandCategory.SYSTEM,
-            aliases=[],
+            aliases=(),
             usage="load",
-            examples=["load"],
+            examples=("load",),
             requires_target=False
-        ))
+        ),
 
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="quit",
             description="Quit the game",
             category=CommandCategory.SYSTEM,
-            aliases=["exit", "q", "logout"],
+            aliases=("exit", "q", "logout"),
             usage="quit",
-            examples=["quit", "exit", "q"],
+            examples=("quit", "exit", "q"),
             requires_target=False
-        ))
+        ),
 
-        self.register(CommandDefinition(
+        CommandDefinition(
             name="menu",
             description="Return to main menu",
             category=CommandCategory.SYSTEM,
-            aliases=["m"],
+            aliases=("m",),
             usage="menu",
-            examples=["menu", "m"],
+            examples=("menu", "m"),
             requires_target=False
-        ))
+        ),
+    )
+
+
+def _index_command(
+    lookup: Dict[str, CommandDefinition],
+    by_category: Dict[CommandCategory, List[CommandDefinition]],
+    sorted_by_category: Dict[CommandCategory, List[CommandDefinition]],
+    command: CommandDefinition
+) -> None:
+    """
+    Add a command to lookup and category indexes.
+
+    Names always win over aliases; among aliases the first registered
+    command keeps the entry.
+
+    Args:
+        lookup: Name/alias -> command map
+        by_category: Category -> commands in registration order
+        sorted_by_category: Category -> commands sorted by name
+        command: Command definition to index
+    """
+    # Interned keys let dict probes with interned strings compare by identity
+    lookup[sys.intern(command.name)] = command
+    for alias in command.aliases:
+        lookup.setdefault(sys.intern(alias.lower()), command)
+
+    by_category[command.category].append(command)
+    bisect.insort(sorted_by_category[command.category], command, key=lambda c: c.name)
+
+
+@functools.cache
+def _default_indexes():
+    """Build the name, lookup and category indexes for the default commands, once."""
+    names = {}
+    lookup = {}
+    by_category = {category: [] for category in _CATEGORIES_ORDERED}
+    sorted_by_category = {category: [] for category in _CATEGORIES_ORDERED}
+
+    for command in _default_commands():
+        names[command.name] = command
+        _index_command(lookup, by_category, sorted_by_category, command)
+
+    return (
+        names,
+        lookup,
+        {k: tuple(v) for k, v in by_category.items()},
+        {k: tuple(v) for k, v in sorted_by_category.items()}
+    )
+
+
+class _TrieNode:
+    """Node in the command prefix trie."""
+
+    __slots__ = ('children', 'command')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.command: Optional[CommandDefinition] = None
+
+
+class CommandTrie:
+    """Prefix trie over command names and aliases for completion."""
+
+    def __init__(self, lookup: Dict[str, CommandDefinition]):
+        """
+        Build trie from a name/alias lookup table.
+
+        Args:
+            lookup: Lowercased name/alias -> command map
+        """
+        self._root = _TrieNode()
+        for key, command in lookup.items():
+            self.insert(key, command)
+
+    def insert(self, key: str, command: CommandDefinition) -> None:
+        """
+        Insert a name or alias.
+
+        Args:
+            key: Lowercased name or alias
+            command: Command the key resolves to
+        """
+        node = self._root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+        node.command = command
+
+    def complete(self, prefix: str) -> List[CommandDefinition]:
+        """
+        Find commands with a name or alias starting with prefix.
+
+        Args:
+            prefix: Lowercased prefix
+
+        Returns:
+            Matching commands, without duplicates, sorted by name
+        """
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        found: Dict[str, CommandDefinition] = {}
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.command is not None:
+                found[node.command.name] = node.command
+            stack.extend(node.children.values())
+
+        return [found[name] for name in sorted(found)]
+
+
+class CommandRegistry:
+    """Registry of all available commands."""
+
+    def __init__(self):
+        """Initialize command registry with the default commands."""
+        name_map, lookup, by_category, sorted_by_category = _default_indexes()
+        self.commands: Dict[str, CommandDefinition] = dict(name_map)
+        # Names and aliases -> command, for O(1) lookup
+        self._lookup: Dict[str, CommandDefinition] = dict(lookup)
+        # Commands per category, in registration order and sorted by name
+        self._by_category: Dict[CommandCategory, List[CommandDefinition]] = {
+            category: list(cmds) for category, cmds in by_category.items()
+        }
+        self._sorted_by_category: Dict[CommandCategory, List[CommandDefinition]] = {
+            category: list(cmds) for category, cmds in sorted_by_category.items()
+        }
+        # Rendered full help text, cleared whenever a command is registered
+        self._full_help_cache: Optional[str] = None
+        # Prefix trie for completion, built on first use
+        self._trie: Optional[CommandTrie] = None
+        # Alternation of all names/aliases for free-text search, built on first use
+        self._command_pattern: Optional[re.Pattern] = None
+        # One-slot cache for repeated get_command lookups
+        self._last_action = ''
+        self._last_cmd: Optional[CommandDefinition] = None
 
     def register(self, command: CommandDefinition) -> None:
         """
@@ -288,8 +454,30 @@ class CommandRegistry:
         Args:
             command: Command definition to register
         """
+        replacing = command.name in self.commands
         self.commands[command.name] = command
 
+        self._full_help_cache = None
+        self._trie = None
+        self._command_pattern = None
+        self._last_action = ''
+        self._last_cmd = None
+
+        if replacing:
+            self._rebuild_indexes()
+        else:
+            _index_command(self._lookup, self._by_category, self._sorted_by_category, command)
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild all indexes from the registered commands."""
+        self._lookup = {}
+        for category in _CATEGORIES_ORDERED:
+            self._by_category[category] = []
+            self._sorted_by_category[category] = []
+
+        for cmd in self.commands.values():
+            _index_command(self._lookup, self._by_category, self._sorted_by_category, cmd)
+
     def get_command(self, action: str) -> Optional[CommandDefinition]:
         """
         Get command definition by action.
@@ -300,18 +488,68 @@ class CommandRegistry:
         Returns:
             CommandDefinition if found, None otherwise
         """
-        action_lower = action.lower()
+        # str.lower() already has an ASCII fast path in CPython; a bytes
+        # translate table round-trip measured ~4x slower for command words
+        return self._get_command_lc(action.lower())
 
-        # Check direct name match first
-        if action_lower in self.commands:
-            return self.commands[action_lower]
+    def _get_command_lc(self, action_lower: str) -> Optional[CommandDefinition]:
+        """
+        Get command definition for an already-lowercased action.
 
-        # Check aliases
-        for cmd in self.commands.values():
-            if cmd.matches(action_lower):
-                return cmd
+        Args:
+            action_lower: Lowercased action string (name or alias)
 
-        return None
+        Returns:
+            CommandDefinition if found, None otherwise
+        """
+        if action_lower == self._last_action:
+            return self._last_cmd
+
+        cmd = self._lookup.get(action_lower)
+        self._last_action = action_lower
+        self._last_cmd = cmd
+        return cmd
+
+    def complete(self, prefix: str) -> List[CommandDefinition]:
+        """
+        Get commands whose name or an alias starts with prefix.
+
+        Args:
+            prefix: Partial command input
+
+        Returns:
+            Matching commands sorted by name
+        """
+        if self._trie is None:
+            self._trie = CommandTrie(self._lookup)
+        return self._trie.complete(prefix.lower())
+
+    def find_command_in(self, text: str) -> Optional[CommandDefinition]:
+        """
+        Find the first command name or alias mentioned in free-form text.
+
+        One-character aliases ("i", "l", "q", ...) are only meaningful as
+        typed commands and are not searched for, so the pronoun in
+        "I want to run away" isn't read as "inventory".
+
+        Args:
+            text: Input such as "please attack the orc"
+
+        Returns:
+            CommandDefinition for the earliest match, None if none found
+        """
+        if self._command_pattern is None:
+            # Longest keys first so multi-word aliases win over their prefixes
+            keys = sorted((k for k in self._lookup if len(k) > 1), key=len, reverse=True)
+            self._command_pattern = re.compile(
+                r"(?<!\w)(?:" + "|".join(re.escape(k) for k in keys) + r")(?!\w)",
+                re.IGNORECASE
+            )
+
+        match = self._command_pattern.search(text)
+        if not match:
+            return None
+        return self._lookup.get(match.group().lower())
 
     def get_commands_by_category(self, category: CommandCategory) -> List[CommandDefinition]:
         """
@@ -323,7 +561,7 @@ class CommandRegistry:
         Returns:
             List of commands in category
         """
-        return [cmd for cmd in self.commands.values() if cmd.category == category]
+        return list(self._by_category[category])
 
     def get_all_commands(self) -> List[CommandDefinition]:
         """
@@ -353,7 +591,7 @@ class CommandRegistry:
         Returns:
             True if valid command
         """
-        return self.get_command(action) is not None
+        return action.lower() in self._lookup
 
     def format_help(self, command_name: Optional[str] = None) -> str:
         """
@@ -366,39 +604,39 @@ class CommandRegistry:
             Formatted help text
         """
         if command_name:
-            cmd = self.get_command(command_name)
+            cmd = self._lookup.get(command_name.lower())
             if not cmd:
                 return f"Unknown command: {command_name}"
-
-            lines = [
-                f"Command: {cmd.name}",
-                f"Description: {cmd.description}",
-                f"Usage: {cmd.usage}",
-                f"Category: {cmd.category.value}",
-            ]
-
-            if cmd.aliases:
-                lines.append(f"Aliases: {', '.join(cmd.aliases)}")
-
-            if cmd.examples:
-                lines.append("Examples:")
-                for example in cmd.examples:
-                    lines.append(f"  - {example}")
-
-            return "\n".join(lines)
+            return cmd._help_detail
 
         else:
+            if self._full_help_cache is not None:
+                return self._full_help_cache
+
             # Show all commands organized by category
             lines = ["Available Commands:", ""]
+            lines_append = lines.append
+            sorted_by_category = self._sorted_by_category
 
-            for category in CommandCategory:
-                cmds = self.get_commands_by_category(category)
+            for category in _CATEGORIES_ORDERED:
+                cmds = sorted_by_category[category]
                 if cmds:
-                    lines.append(f"{category.value}:")
-                    for cmd in sorted(cmds, key=lambda c: c.name):
-                        alias_text = f" ({', '.join(cmd.aliases)})" if cmd.aliases else ""
-                        lines.append(f"  {cmd.name}{alias_text} - {cmd.description}")
-                    lines.append("")
+                    lines_append(_CATEGORY_HEADERS[category])
+                    for cmd in cmds:
+                        lines_append(cmd._help_line)
+                    lines_append("")
 
             lines.append("Type 'help <command>' for detailed information about a specific command.")
-            return "\n".join(lines)
+            self._full_help_cache = "\n".join(lines)
+            return self._full_help_cache
+
+
+@functools.cache
+def get_registry() -> CommandRegistry:
+    """
+    Get the shared command registry, creating it on first use.
+
+    Returns:
+        Process-wide CommandRegistry instance
+    """
+    return CommandRegistry()
@@ -1,14 +1,17 @@
 """Main game loop and state management."""
 
-from typing import Optional, Dict, Any
+from collections import deque
+import copy
+import functools
+from typing import Callable, Optional, Dict, Any, Deque, Tuple
 import logging
 
 from .state_machine import StateMachine, GameState
 from .output import OutputFormatter, Color, Style
 from .input_handler import InputHandler, ParsedCommand
-from .commands import CommandRegistry, CommandDefinition
+from .commands import CommandRegistry, CommandDefinition, get_registry
 
-from ..config.settings import Settings
+from ..config.settings import Config, load_config
 from ..data import DataLoader
 from ..auth import AccountManager
 from ..character import PlayerCharacter, CoreAttributes
@@ -16,25 +19,113 @@ from ..combat import Battle, BattleResult, create_goblin, create_orc
 
 logger = logging.getLogger(__name__)
 
+# Static menu options and narrative text
+_MAIN_MENU_OPTIONS = ("Login", "Register", "Quit")
+_MAIN_MENU_USER_OPTIONS = ("Logout", "Quit")  # Follows "Continue as <user>"
+_PAUSE_OPTIONS = ("Resume", "Save Game", "Return to Main Menu", "Quit")
+
+_CHARACTER_SELECT_INTRO = (
+    "Two boys from Crydee will shape the fate of two worlds.\n"
+    "Choose whose journey you will follow:"
+)
+_TOMAS_DESCRIPTION = (
+    "Follow the path of martial prowess and ancient power.\n"
+    "Face the Tsurani invasion and discover the secrets of the Valheru."
+)
+_PUG_DESCRIPTION = (
+    "Follow the path of magic and knowledge.\n"
+    "From apprentice to master, across two worlds,\n"
+    "become the greatest magician of the age."
+)
+_JOURNEY_START_TEXT = (
+    "\nYour journey begins in Crydee, a small town on the western frontier of the Kingdom..."
+)
+_COURTYARD_LOOK_TEXT = (
+    "You stand in the courtyard of Castle Crydee. "
+    "The castle walls rise high above you. To the north is the keep, "
+    "to the east are the stables, and to the west lies the training ground."
+)
+_COURTYARD_TEXT = (
+    "You stand in the courtyard of Castle Crydee. "
+    "The sounds of daily life echo around you."
+)
+
+# Appended to the full help listing
+_COMMAND_CHAINING_HINT = "Chain several commands with ';' (e.g., 'look; north; take sword')."
+
+# Action list shown under the combat status (follows the enemy lines)
+_COMBAT_ACTIONS_TEXT = (
+    "\nActions:\n"
+    "  attack <target> - Attack enemy (e.g., 'attack 1')\n"
+    "  defend - Take defensive stance\n"
+    "  flee - Attempt to flee\n"
+    "  inventory - View inventory\n"
+    "\n"
+)
+
+# Commands that act on the player character
+_GAMEPLAY_ACTIONS = frozenset({
+    "look", "move", "take", "drop", "use", "attack", "talk", "inventory", "stats"
+})
+
+# Placeholder messages for commands that have no handler yet
+_UNIMPLEMENTED_COMMANDS = {
+    "take": "Take command not yet implemented",
+    "drop": "Drop command not yet implemented",
+    "use": "Use command not yet implemented",
+    "talk": "Dialogue not yet implemented",
+}
+
 
 class GameLoop:
     """Main game loop controller."""
 
-    def __init__(self, config: Optional[Settings] = None):
+    __slots__ = (
+        'config',
+        'state_machine',
+        'output',
+        'input_handler',
+        'data_loader',
+        'account_manager',
+        'running',
+        'player',
+        'current_user',
+        'current_battle',
+        '_character_templates',
+        '_cmd_queue',
+        '_rendered_location',
+        '_handlers',
+        '_command_handlers',
+        '_combat_handlers',
+        '_main_menu_actions',
+        '_user_menu_actions',
+        '_pause_actions',
+        '_user_menu',
+        '_main_menu_text',
+        '_pause_menu_text',
+        '_character_select_text',
+        '_playing_text',
+        '_look_text',
+        '_journey_start_text',
+        '_help_header',
+        '_quit_text'
+    )
+
+    def __init__(self, config: Optional[Config] = None):
         """
         Initialize game loop.
 
         Args:
             config: Game configuration
         """
-        self.config = config or Settings()
+        self.config = config or load_config()
         self.state_machine = StateMachine()
         self.output = OutputFormatter(
             use_colors=self.config.get('display.use_colors', True),
-            clear_screen=self.config.get('display.clear_screen', True)
+            clear_screen=self.config.get('display.clear_screen', True),
+            line_editing=self.config.get('display.line_editing', True)
         )
         self.input_handler = InputHandler()
-        self.command_registry = CommandRegistry()
         self.data_loader = DataLoader()
         self.account_manager = AccountManager()
 
@@ -43,6 +134,110 @@ class GameLoop:
         self.current_user: Optional[str] = None
         self.current_battle: Optional[Battle] = None
 
+        # Character name -> (base attributes, level, starting inventory),
+        # built once per session from the character data
+        self._character_templates: Dict[str, Tuple[CoreAttributes, int, Tuple[Dict[str, Any], ...]]] = {}
+
+        # Commands queued from one line of input ("look; n; take sword")
+        self._cmd_queue: Deque[ParsedCommand] = deque()
+
+        # Location whose banner is currently on screen (None forces a redraw)
+        self._rendered_location: Optional[str] = None
+
+        # State -> handler dispatch table
+        self._handlers: Dict[GameState, Callable[[], None]] = {
+            GameState.MAIN_MENU: self._handle_main_menu,
+            GameState.LOGIN: self._handle_login,
+            GameState.REGISTER: self._handle_register,
+            GameState.CHARACTER_SELECT: self._handle_character_select,
+            GameState.PLAYING: self._handle_playing,
+            GameState.COMBAT: self._handle_combat,
+            GameState.INVENTORY: self._handle_inventory,
+            GameState.STATS: self._handle_stats,
+            GameState.PAUSE: self._handle_pause,
+            GameState.QUIT: self._handle_quit,
+        }
+
+        # Command name -> handler dispatch table (names already resolved via the registry)
+        self._command_handlers: Dict[str, Callable[[ParsedCommand], None]] = {
+            "quit": self._cmd_quit,
+            "menu": self._cmd_menu,
+            "help": self._cmd_help,
+            "inventory": self._cmd_inventory,
+            "stats": self._cmd_stats,
+            "look": self._cmd_look,
+            "move": self._cmd_move,
+            "attack": self._cmd_attack,
+        }
+        for name, message in _UNIMPLEMENTED_COMMANDS.items():
+            self._command_handlers[name] = functools.partial(self._cmd_placeholder, message)
+
+        # Combat command -> handler dispatch table
+        self._combat_handlers: Dict[str, Callable[[ParsedCommand], None]] = {
+            "attack": self._combat_attack,
+            "defend": self._combat_defend,
+            "flee": self._combat_flee,
+            "inventory": self._cmd_inventory,
+        }
+
+        # Menu choice -> action tables
+        transition_to = self.state_machine.transition_to
+        self._main_menu_actions: Dict[str, Callable[[], Any]] = {
+            "1": functools.partial(transition_to, GameState.LOGIN),
+            "2": functools.partial(transition_to, GameState.REGISTER),
+            "3": functools.partial(transition_to, GameState.QUIT),
+        }
+        self._user_menu_actions: Dict[str, Callable[[], Any]] = {
+            "1": functools.partial(transition_to, GameState.CHARACTER_SELECT),
+            "2": self._logout,
+            "3": functools.partial(transition_to, GameState.QUIT),
+        }
+        self._pause_actions: Dict[str, Callable[[], Any]] = {
+            "1": self.state_machine.go_back,
+            "2": self._pause_save,
+            "3": self._pause_main_menu,
+            "4": self._pause_quit,
+        }
+
+        self._user_menu: Tuple[Optional[str], str] = (None, "")
+        self._render_static_text()
+        self.output.add_color_listener(self._render_static_text)
+
+    @property
+    def command_registry(self) -> CommandRegistry:
+        """Shared command registry, only built once gameplay needs it."""
+        return get_registry()
+
+    def _render_static_text(self):
+        """Pre-render fixed menus and screens; re-run whenever use_colors changes."""
+        out = self.output
+        self._user_menu = (None, "")
+
+        self._main_menu_text = out.format_section("MAIN MENU") + out.format_menu("", _MAIN_MENU_OPTIONS)
+        self._pause_menu_text = out.format_section("PAUSED") + out.format_menu("", _PAUSE_OPTIONS)
+
+        self._character_select_text = "".join([
+            out.format_section("CHOOSE YOUR PATH"),
+            out.format_story(_CHARACTER_SELECT_INTRO),
+            out.colorize("1. TOMAS - The Warrior", Color.RED, Style.BOLD) + "\n",
+            out.format_story(_TOMAS_DESCRIPTION, indent=3),
+            out.colorize("2. PUG - The Mage", Color.BLUE, Style.BOLD) + "\n",
+            out.format_story(_PUG_DESCRIPTION, indent=3),
+            "0. Back to Main Menu\n\n",
+        ])
+
+        self._playing_text = out.format_story(_COURTYARD_TEXT)
+        self._look_text = out.format_story(_COURTYARD_LOOK_TEXT)
+        self._journey_start_text = out.format_story(_JOURNEY_START_TEXT, indent=2)
+        self._help_header = out.format_section("HELP")
+
+        self._quit_text = "".join([
+            "\n",
+            out.colorize("Thank you for playing The Magician!", Color.BRIGHT_CYAN, Style.BOLD) + "\n",
+            out.format_story("May your journey through Midkemia continue...", indent=5),
+            "\n",
+        ])
+
     def run(self):
         """Start the main game loop."""
         self.running = True
@@ -52,34 +247,21 @@ class GameLoop:
             indent=10
         )
 
+        # Enum hashing is a Python-level call, so only hit the dispatch
+        # table when the state actually changes (identity check otherwise)
+        handlers = self._handlers
+        state_machine = self.state_machine
+        last_state = None
+        handler = None
+
         while self.running:
-            try:
-                state = self.state_machine.current_state
-
-                if state == GameState.MAIN_MENU:
-                    self._handle_main_menu()
-                elif state == GameState.LOGIN:
-                    self._handle_login()
-                elif state == GameState.REGISTER:
-                    self._handle_register()
-                elif state == GameState.CHARACTER_SELECT:
-                    self._handle_character_select()
-                elif state == GameState.PLAYING:
-                    self._handle_playing()
-                elif state == GameState.COMBAT:
-                    self._handle_combat()
-                elif state == GameState.INVENTORY:
-                    self._handle_inventory()
-                elif state == GameState.STATS:
-                    self._handle_stats()
-                elif state == GameState.PAUSE:
-                    self._handle_pause()
-                elif state == GameState.QUIT:
-                    self._handle_quit()
-                else:
-                    self.output.print_error(f"Unknown state: {state}")
-                    self.state_machine.transition_to(GameState.MAIN_MENU)
+            state = state_machine.current_state
+            if state is not last_state:
+                handler = handlers.get(state, self._handle_unknown_state)
+                last_state = state
 
+            try:
+                handler()
             except KeyboardInterrupt:
                 print()
                 if self.output.confirm("Are you sure you want to quit?"):
@@ -88,48 +270,45 @@ class GameLoop:
                     continue
 
             except Exception as e:
-                logger.error(f"Error in game loop: {e}", exc_info=True)
+                # Full tracebacks only when debugging; the message is formatted lazily
+                logger.error("Error in game loop: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
                 self.output.print_error(f"An error occurred: {e}")
                 self.output.pause()
 
+    def _handle_unknown_state(self):
+        """Recover from a state that has no handler."""
+        self.output.print_error(f"Unknown state: {self.state_machine.current_state}")
+        self.state_machine.transition_to(GameState.MAIN_MENU)
+
     def _handle_main_menu(self):
         """Display and handle main menu."""
-        self.output.print_section("MAIN MENU")
-
-        options = []
         if self.current_user:
-            options.extend([
-                f"Continue as {self.current_user}",
-                "Logout",
-                "Quit"
-            ])
-            self.output.print_menu("", options, numbered=True)
-            choice = self.output.prompt("> ")
-
-            if choice == "1":
-                self.state_machine.transition_to(GameState.CHARACTER_SELECT)
-            elif choice == "2":
-                self.current_user = None
-                self.player = None
-                self.output.print_success("Logged out successfully")
-                self.output.pause()
-            elif choice == "3":
-                self.state_machine.transition_to(GameState.QUIT)
+            self.output.write(self._user_menu_text())
+            actions = self._user_menu_actions
         else:
-            options.extend([
-                "Login",
-                "Register",
-                "Quit"
-            ])
-            self.output.print_menu("", options, numbered=True)
-            choice = self.output.prompt("> ")
-
-            if choice == "1":
-                self.state_machine.transition_to(GameState.LOGIN)
-            elif choice == "2":
-                self.state_machine.transition_to(GameState.REGISTER)
-            elif choice == "3":
-                self.state_machine.transition_to(GameState.QUIT)
+            self.output.write(self._main_menu_text)
+            actions = self._main_menu_actions
+
+        action = actions.get(self.output.prompt("> "))
+        if action is not None:
+            action()
+
+    def _logout(self):
+        """Log out the current user."""
+        self.current_user = None
+        self.player = None
+        self.output.print_success("Logged out successfully")
+        self.output.pause()
+
+    def _user_menu_text(self) -> str:
+        """Main menu text for the logged-in user, rendered once per user."""
+        if self._user_menu[0] != self.current_user:
+            options = (f"Continue as {self.current_user}",) + _MAIN_MENU_USER_OPTIONS
+            self._user_menu = (
+                self.current_user,
+                self.output.format_section("MAIN MENU") + self.output.format_menu("", options)
+            )
+        return self._user_menu[1]
 
     def _handle_login(self):
         """Handle user login."""
@@ -182,29 +361,7 @@ class GameLoop:
 
     def _handle_character_select(self):
         """Handle character/path selection."""
-        self.output.print_section("CHOOSE YOUR PATH")
-
-        self.output.print_story(
-            "Two boys from Crydee will shape the fate of two worlds.\n"
-            "Choose whose journey you will follow:"
-        )
-
-        self.output.print_colored("1. TOMAS - The Warrior", Color.RED, Style.BOLD)
-        self.output.print_story(
-            "Follow the path of martial prowess and ancient power.\n"
-            "Face the Tsurani invasion and discover the secrets of the Valheru.",
-            indent=3
-        )
-
-        self.output.print_colored("2. PUG - The Mage", Color.BLUE, Style.BOLD)
-        self.output.print_story(
-            "Follow the path of magic and knowledge.\n"
-            "From apprentice to master, across two worlds,\n"
-            "become the greatest magician of the age.",
-            indent=3
-        )
-
-        print("0. Back to Main Menu\n")
+        self.output.write(self._character_select_text)
 
         choice = self.output.prompt("> ")
 
@@ -224,34 +381,41 @@ class GameLoop:
         Args:
             character_name: Character to create (tomas/pug)
         """
-        character_data = self.data_loader.load_character(character_name)
-        if not character_data:
-            self.output.print_error(f"Failed to load character data for {character_name}")
-            return
+        template = self._character_templates.get(character_name)
+        if template is None:
+            character_data = self.data_loader.load_character(character_name)
+            if not character_data:
+                self.output.print_error(f"Failed to load character data for {character_name}")
+                return
+            template = (
+                CoreAttributes.from_dict(character_data.get('base_stats', {})),
+                character_data.get('level', 1),
+                tuple(character_data.get('starting_inventory', ())),
+            )
+            self._character_templates[character_name] = template
+
+        attributes, level, starting_inventory = template
 
-        # Create character with attributes from data
-        attributes = CoreAttributes.from_dict(character_data.get('base_stats', {}))
+        # Create character; the template attributes are copied since players mutate them
         self.player = PlayerCharacter(
             username=self.current_user,
             character_name=character_name,
             path=character_name,
-            attributes=attributes,
-            level=character_data.get('level', 1),
+            attributes=copy.copy(attributes),
+            level=level,
             xp=0
         )
 
-        # Load starting inventory
-        starting_inventory = character_data.get('starting_inventory', [])
-        self.player.inventory = starting_inventory
+        # Load starting inventory (copied, since the template is shared)
+        self.player.inventory = [dict(item) for item in starting_inventory]
 
         self.output.clear()
         self.output.print_success(f"You have chosen the path of {character_name.upper()}")
-        self.output.print_story(
-            f"\nYour journey begins in Crydee, a small town on the western frontier of the Kingdom...",
-            indent=2
-        )
+        self.output.write(self._journey_start_text)
         self.output.pause()
 
+        self._cmd_queue.clear()
+        self._rendered_location = None
         self.state_machine.transition_to(GameState.PLAYING)
 
     def _handle_playing(self):
@@ -260,22 +424,33 @@ class GameLoop:
             self.state_machine.transition_to(GameState.MAIN_MENU)
             return
 
-        # Display location (simplified for now)
-        self.output.print_section(f"Location: {self.player.location.title()}")
-        self.output.print_story(
-            "You stand in the courtyard of Castle Crydee. "
-            "The sounds of daily life echo around you."
-        )
-
-        # Get command
-        user_input = self.output.prompt("> ")
-        command = self.input_handler.parse(user_input)
-
-        if not command:
-            return
-
-        # Process command
-        self._process_command(command)
+        if not self._cmd_queue:
+            # Display location (simplified for now), only when it changed
+            location = self.player.location
+            if location != self._rendered_location:
+                self.output.write(
+                    self.output.format_section(f"Location: {location.title()}")
+                    + self._playing_text
+                )
+                self._rendered_location = location
+
+            # Get commands; several may be chained with ';'
+            user_input = self.output.prompt("> ")
+            parse = self.input_handler.parse
+            for part in user_input.split(";"):
+                command = parse(part)
+                if command:
+                    self._cmd_queue.append(command)
+
+        # Drain the queue until a command leaves the playing state
+        queue = self._cmd_queue
+        state_machine = self.state_machine
+        while queue and state_machine.current_state == GameState.PLAYING:
+            self._process_command(queue.popleft())
+
+        # Other screens draw over the location, so redraw it on return
+        if state_machine.current_state != GameState.PLAYING:
+            self._rendered_location = None
 
     def _process_command(self, command: ParsedCommand):
         """
@@ -284,56 +459,59 @@ class GameLoop:
         Args:
             command: Parsed command to execute
         """
-        action = command.action
+        # Resolve names and aliases through the registry's lookup table
+        # (ParsedCommand actions are already lowercased)
+        cmd_def = self.command_registry._get_command_lc(command.action)
+        if not cmd_def:
+            self.output.print_error(f"Unknown command: {command.action}")
+            self.output.print_info("Type 'help' for available commands")
+            return
 
-        # System commands
-        if action == "quit":
-            self.state_machine.transition_to(GameState.QUIT)
-        elif action == "menu":
-            if self.output.confirm("Return to main menu?"):
-                self.state_machine.transition_to(GameState.MAIN_MENU)
-        elif action == "help":
-            self._show_help(command.targets[0] if command.targets else None)
-        elif action == "inventory":
-            self.state_machine.transition_to(GameState.INVENTORY)
-        elif action == "stats":
-            self.state_machine.transition_to(GameState.STATS)
-
-        # Gameplay commands
-        elif action == "look":
-            self._cmd_look(command)
-        elif action == "move":
-            self._cmd_move(command)
-        elif action == "take":
-            self.output.print_info("Take command not yet implemented")
-        elif action == "drop":
-            self.output.print_info("Drop command not yet implemented")
-        elif action == "use":
-            self.output.print_info("Use command not yet implemented")
-        elif action == "attack":
-            self._start_combat()
-        elif action == "talk":
-            self.output.print_info("Dialogue not yet implemented")
+        if self.player is None and cmd_def.name in _GAMEPLAY_ACTIONS:
+            self.output.print_error("No active character")
+            return
 
+        handler = self._command_handlers.get(cmd_def.name)
+        if handler is not None:
+            handler(command)
         else:
-            # Check if it's a valid command
-            cmd_def = self.command_registry.get_command(action)
-            if cmd_def:
-                self.output.print_info(f"{cmd_def.description} - Not yet implemented")
-            else:
-                self.output.print_error(f"Unknown command: {action}")
-                self.output.print_info("Type 'help' for available commands")
+            self.output.print_info(f"{cmd_def.description} - Not yet implemented")
+
+    def _cmd_placeholder(self, message: str, command: ParsedCommand):
+        """Report a command that is recognised but not implemented yet."""
+        self.output.print_info(message)
+
+    def _cmd_quit(self, command: ParsedCommand):
+        """Handle quit command."""
+        self.state_machine.transition_to(GameState.QUIT)
+
+    def _cmd_menu(self, command: ParsedCommand):
+        """Handle menu command."""
+        if self.output.confirm("Return to main menu?"):
+            self.state_machine.transition_to(GameState.MAIN_MENU)
+
+    def _cmd_help(self, command: ParsedCommand):
+        """Handle help command."""
+        self._show_help(command.targets[0] if command.targets else None)
+
+    def _cmd_inventory(self, command: ParsedCommand):
+        """Handle inventory command."""
+        self.state_machine.transition_to(GameState.INVENTORY)
+
+    def _cmd_stats(self, command: ParsedCommand):
+        """Handle stats command."""
+        self.state_machine.transition_to(GameState.STATS)
+
+    def _cmd_attack(self, command: ParsedCommand):
+        """Handle attack command."""
+        self._start_combat()
 
     def _cmd_look(self, command: ParsedCommand):
         """Handle look command."""
-        if not command.targets:
-            self.output.print_story(
-                "You stand in the courtyard of Castle Crydee. "
-                "The castle walls rise high above you. To the north is the keep, "
-                "to the east are the stables, and to the west lies the training ground."
-            )
+        target = command.target_phrase
+        if not target:
+            self.output.write(self._look_text)
         else:
-            target = " ".join(command.targets)
             self.output.print_info(f"You examine the {target}, but see nothing special.")
 
     def _cmd_move(self, command: ParsedCommand):
@@ -352,10 +530,11 @@ class GameLoop:
         Args:
             command_name: Specific command to get help for, or None for all
         """
+        # The registry memoizes the help text itself; only the screen is assembled here
         help_text = self.command_registry.format_help(command_name)
-        self.output.print_section("HELP")
-        print(help_text)
-        print()
+        if command_name is None:
+            help_text = f"{help_text}\n{_COMMAND_CHAINING_HINT}"
+        self.output.write(f"{self._help_header}{help_text}\n\n")
         self.output.pause()
 
     def _handle_inventory(self):
@@ -364,18 +543,20 @@ class GameLoop:
             self.state_machine.go_back()
             return
 
-        self.output.print_section(f"{self.player.character_name.title()}'s Inventory")
+        out = self.output
+        parts = [out.format_section(f"{self.player.display_name}'s Inventory")]
 
         if not self.player.inventory:
-            self.output.print_info("Your inventory is empty.")
+            parts.append(out.format_info("Your inventory is empty."))
         else:
             for item in self.player.inventory:
                 item_name = item.get('item', 'Unknown')
                 quantity = item.get('quantity', 1)
-                self.output.print_colored(f"  • {item_name} x{quantity}", Color.YELLOW)
+                parts.append(out.colorize(f"  • {item_name} x{quantity}", Color.YELLOW) + "\n")
 
-        print()
-        self.output.pause()
+        parts.append("\n")
+        out.write("".join(parts))
+        out.pause()
         self.state_machine.go_back()
 
     def _handle_stats(self):
@@ -387,53 +568,42 @@ class GameLoop:
         # Get XP progress
         xp_info = self.player.get_xp_progress()
 
-        self.output.print_section(f"{self.player.character_name.title()} - Level {self.player.level}")
-
-        # Core attributes
-        stats_display = {
-            "Strength": self.player.attributes.strength,
-            "Constitution": self.player.attributes.constitution,
-            "Agility": self.player.attributes.agility,
-            "Intelligence": self.player.attributes.intelligence,
-            "Willpower": self.player.attributes.willpower,
-            "Charisma": self.player.attributes.charisma,
-        }
-
-        self.output.print_stats(stats_display)
-        print()
-
-        # Derived stats
-        derived_display = {
-            "Health": f"{self.player.derived_stats.current_health}/{self.player.derived_stats.max_health}",
-            "Mana": f"{self.player.derived_stats.current_mana}/{self.player.derived_stats.max_mana}",
-            "Stamina": f"{self.player.derived_stats.current_stamina}/{self.player.derived_stats.max_stamina}",
-            "Carry Capacity": f"{self.player.derived_stats.carry_capacity} lbs",
-            "Initiative": self.player.derived_stats.initiative,
-        }
-
-        self.output.print_stats(derived_display)
-        print()
-
-        # Experience
-        xp_display = {
-            "Total XP": xp_info['total_xp'],
-            "Progress to Next Level": f"{xp_info['progress_xp']}/{xp_info['needed_xp']} ({xp_info['percentage']:.1f}%)",
-        }
+        out = self.output
+        derived = self.player.derived_stats
+        stats_display = [
+            # Core attributes
+            *self.player.get_attribute_display(),
+            None,
+            # Derived stats
+            ("Health", f"{derived.current_health}/{derived.max_health}"),
+            ("Mana", f"{derived.current_mana}/{derived.max_mana}"),
+            ("Stamina", f"{derived.current_stamina}/{derived.max_stamina}"),
+            ("Carry Capacity", f"{derived.carry_capacity} lbs"),
+            ("Initiative", derived.initiative),
+            None,
+            # Experience
+            ("Total XP", xp_info['total_xp']),
+            ("Progress to Next Level", f"{xp_info['progress_xp']}/{xp_info['needed_xp']} ({xp_info['percentage']:.1f}%)"),
+        ]
 
         if self.player.unspent_stat_points > 0:
-            xp_display["Unspent Stat Points"] = self.player.unspent_stat_points
+            stats_display.append(("Unspent Stat Points", self.player.unspent_stat_points))
 
-        self.output.print_stats(xp_display)
-        print()
+        stats_display.append(None)
+
+        parts = [
+            out.format_section(f"{self.player.display_name} - Level {self.player.level}"),
+            out.format_stats(stats_display),
+        ]
 
         # Abilities
         if self.player.abilities:
-            self.output.print_colored("Abilities:", Color.YELLOW, Style.BOLD)
-            for ability in self.player.abilities:
-                print(f"  • {ability}")
-            print()
+            parts.append(out.colorize("Abilities:", Color.YELLOW, Style.BOLD) + "\n")
+            parts.extend(f"  • {ability}\n" for ability in self.player.abilities)
+            parts.append("\n")
 
-        self.output.pause()
+        out.write("".join(parts))
+        out.pause()
         self.state_machine.go_back()
 
     def _start_combat(self):
@@ -466,90 +636,90 @@ class GameLoop:
             self._end_combat()
             return
 
-        # Show battle state
-        self.output.clear()
-        self.output.print_section("COMBAT - Turn {}".format(self.current_battle.turn_number + 1))
-
-        # Show player status
-        player_health = f"{self.player.derived_stats.current_health}/{self.player.derived_stats.max_health}"
-        player_mana = f"{self.player.derived_stats.current_mana}/{self.player.derived_stats.max_mana}"
-        player_stamina = f"{self.player.derived_stats.current_stamina}/{self.player.derived_stats.max_stamina}"
-
-        self.output.print_colored(f"Your Status: HP {player_health} | MP {player_mana} | ST {player_stamina}", Color.GREEN)
+        # Show battle state; the whole frame is assembled and written at once
+        out = self.output
+        out.clear()
+        header = out.format_section(f"COMBAT - Turn {self.current_battle.turn_number + 1}")
+
+        # Player status
+        ds = self.player.derived_stats
+        player_health = f"{ds.current_health}/{ds.max_health}"
+        player_mana = f"{ds.current_mana}/{ds.max_mana}"
+        player_stamina = f"{ds.current_stamina}/{ds.max_stamina}"
+        lines = [
+            out.colorize(f"Your Status: HP {player_health} | MP {player_mana} | ST {player_stamina}", Color.GREEN),
+            "\nEnemies:",
+        ]
 
-        # Show enemies
-        print("\nEnemies:")
+        # Enemies
         for i, enemy in enumerate(self.current_battle.enemies):
-            if enemy.is_alive():
-                enemy_health = f"{enemy.derived_stats.current_health}/{enemy.derived_stats.max_health}"
-                self.output.print_colored(
-                    f"  {i+1}. {enemy.name} - HP {enemy_health}",
-                    Color.RED
-                )
+            enemy_ds = enemy.derived_stats
+            if enemy_ds.current_health > 0:
+                enemy_health = f"{enemy_ds.current_health}/{enemy_ds.max_health}"
+                lines.append(out.colorize(f"  {i+1}. {enemy.name} - HP {enemy_health}", Color.RED))
 
-        # Show available actions
-        print("\nActions:")
-        print("  attack <target> - Attack enemy (e.g., 'attack 1')")
-        print("  defend - Take defensive stance")
-        print("  flee - Attempt to flee")
-        print("  inventory - View inventory")
-        print()
+        # Available actions
+        lines.append(_COMBAT_ACTIONS_TEXT)
+        out.write(header + "\n".join(lines))
 
         # Get player action
         user_input = self.output.prompt("> ")
-        command = self.input_handler.parse(user_input)
+        command = self.input_handler.parse_combat(user_input)
 
         if not command:
             return
 
         # Process combat command
-        if command.action == "attack":
-            target_index = 0
-            if command.targets:
-                try:
-                    target_index = int(command.targets[0]) - 1
-                except ValueError:
-                    self.output.print_error("Invalid target number")
-                    self.output.pause()
-                    return
-
-            result = self.current_battle.player_turn("Attack", target_index)
-            self._show_combat_result(result)
-
-            # Enemy turns
-            if self.current_battle.result == BattleResult.ONGOING:
-                self._execute_enemy_turns()
+        handler = self._combat_handlers.get(command.action)
+        if handler is not None:
+            handler(command)
+        else:
+            self.output.print_error("Unknown combat command")
+            self.output.pause()
 
-            self.current_battle.next_turn()
+    def _combat_attack(self, command: ParsedCommand):
+        """Combat: attack the chosen (or first) enemy."""
+        target_index = 0
+        if command.targets:
+            try:
+                target_index = int(command.targets[0]) - 1
+            except ValueError:
+                self.output.print_error("Invalid target number")
+                self.output.pause()
+                return
 
-        elif command.action == "defend":
-            result = self.current_battle.player_turn("Defend")
-            self._show_combat_result(result)
+        result = self.current_battle.player_turn("Attack", target_index)
+        self._show_combat_result(result)
 
-            # Enemy turns
-            if self.current_battle.result == BattleResult.ONGOING:
-                self._execute_enemy_turns()
+        # Enemy turns
+        if self.current_battle.result == BattleResult.ONGOING:
+            self._execute_enemy_turns()
 
-            self.current_battle.next_turn()
+        self.current_battle.next_turn()
 
-        elif command.action == "flee":
-            result = self.current_battle.attempt_flee()
-            self.output.print_info(result['message'])
+    def _combat_defend(self, command: ParsedCommand):
+        """Combat: take a defensive stance."""
+        result = self.current_battle.player_turn("Defend")
+        self._show_combat_result(result)
 
-            if result.get('success'):
-                self.output.pause()
-                self._end_combat()
-            else:
-                # Enemy gets free turn
-                self._execute_enemy_turns()
-                self.current_battle.next_turn()
-                self.output.pause()
+        # Enemy turns
+        if self.current_battle.result == BattleResult.ONGOING:
+            self._execute_enemy_turns()
+
+        self.current_battle.next_turn()
 
-        elif command.action == "inventory":
-            self.state_machine.transition_to(GameState.INVENTORY)
+    def _combat_flee(self, command: ParsedCommand):
+        """Combat: attempt to flee."""
+        result = self.current_battle.attempt_flee()
+        self.output.print_info(result['message'])
 
+        if result.get('success'):
+            self.output.pause()
+            self._end_combat()
         else:
-            self.output.print_error("Unknown combat command")
+            # Enemy gets free turn
+            self._execute_enemy_turns()
+            self.current_battle.next_turn()
             self.output.pause()
 
     def _show_combat_result(self, result: Dict[str, Any]):
@@ -566,15 +736,10 @@ class GameLoop:
 
     def _execute_enemy_turns(self):
         """Execute all enemy turns."""
-        for i, enemy in enumerate(self.current_battle.enemies):
-            if not enemy.is_alive():
-                continue
-
+        # Iterates a snapshot: the battle rebuilds the list when an enemy falls
+        for i in self.current_battle.live_enemy_indices:
             result = self.current_battle.enemy_turn(i)
 
-            if result.get('skipped'):
-                continue
-
             self.output.print_warning(result.get('message', 'Enemy acts!'))
 
             if result.get('critical'):
@@ -596,21 +761,19 @@ class GameLoop:
         self.output.print_section("COMBAT ENDED")
 
         if self.current_battle.result == BattleResult.VICTORY:
-            rewards = self.current_battle.get_battle_state().get('rewards', {})
             self.output.print_success("Victory!")
 
-            if 'rewards' in self.current_battle.__dict__ or hasattr(self.current_battle, '_calculate_rewards'):
-                rewards = self.current_battle._calculate_rewards()
-                xp_gained = rewards.get('xp', 0)
-                gold_gained = rewards.get('gold', 0)
+            rewards = self.current_battle._calculate_rewards()
+            xp_gained = rewards.get('xp', 0)
+            gold_gained = rewards.get('gold', 0)
 
-                self.output.print_info(f"You gained {xp_gained} XP and {gold_gained} gold!")
+            self.output.print_info(f"You gained {xp_gained} XP and {gold_gained} gold!")
 
-                # Award XP
-                level_up_info = self.player.gain_xp(xp_gained)
-                if level_up_info:
-                    self.output.print_success(f"LEVEL UP! You are now level {level_up_info['new_level']}!")
-                    self.output.print_info(f"You gained {level_up_info['stat_points_gained']} stat points!")
+            # Award XP
+            level_up_info = self.player.gain_xp(xp_gained)
+            if level_up_info:
+                self.output.print_success(f"LEVEL UP! You are now level {level_up_info['new_level']}!")
+                self.output.print_info(f"You gained {level_up_info['stat_points_gained']} stat points!")
 
         elif self.current_battle.result == BattleResult.DEFEAT:
             self.output.print_error("You have been defeated!")
@@ -625,41 +788,28 @@ class GameLoop:
 
     def _handle_pause(self):
         """Handle pause menu."""
-        self.output.print_section("PAUSED")
+        self.output.write(self._pause_menu_text)
 
-        options = [
-            "Resume",
-            "Save Game",
-            "Return to Main Menu",
-            "Quit"
-        ]
+        action = self._pause_actions.get(self.output.prompt("> "))
+        if action is not None:
+            action()
 
-        self.output.print_menu("", options, numbered=True)
-        choice = self.output.prompt("> ")
+    def _pause_save(self):
+        """Pause menu: save the game."""
+        self.output.print_info("Save functionality not yet implemented")
+        self.output.pause()
 
-        if choice == "1":
-            self.state_machine.go_back()
-        elif choice == "2":
-            self.output.print_info("Save functionality not yet implemented")
-            self.output.pause()
-        elif choice == "3":
-            if self.output.confirm("Return to main menu? (Unsaved progress will be lost)"):
-                self.state_machine.transition_to(GameState.MAIN_MENU)
-        elif choice == "4":
-            if self.output.confirm("Quit game? (Unsaved progress will be lost)"):
-                self.state_machine.transition_to(GameState.QUIT)
+    def _pause_main_menu(self):
+        """Pause menu: return to the main menu."""
+        if self.output.confirm("Return to main menu? (Unsaved progress will be lost)"):
+            self.state_machine.transition_to(GameState.MAIN_MENU)
+
+    def _pause_quit(self):
+        """Pause menu: quit the game."""
+        if self.output.confirm("Quit game? (Unsaved progress will be lost)"):
+            self.state_machine.transition_to(GameState.QUIT)
 
     def _handle_quit(self):
         """Handle game exit."""
-        print()
-        self.output.print_colored(
-            "Thank you for playing The Magician!",
-            Color.BRIGHT_CYAN,
-            Style.BOLD
-        )
-        self.output.print_story(
-            "May your journey through Midkemia continue...",
-            indent=5
-        )
-        print()
+        self.output.write(self._quit_text)
         self.running = False
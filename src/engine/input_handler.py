@@ -1,13 +1,29 @@
 """Input handling and command parsing."""
 
 import re
-from typing import Optional, List, Tuple, Dict
+from typing import Collection, Optional, List, Tuple, Dict
+
+
+_NUMBER_RE = re.compile(r'\d+')
+_LEADING_NUMBER_RE = re.compile(r'\s*(\d+)')
+
+# Word kinds in InputHandler._WORD_CLASS
+_DIRECTION = 0
+_PREPOSITION = 1
 
 
 class ParsedCommand:
     """Represents a parsed command from user input."""
 
-    def __init__(self, action: str, targets: List[str], modifiers: Dict[str, str]):
+    __slots__ = ('action', 'targets', 'modifiers', '_target_phrase')
+
+    def __init__(
+        self,
+        action: str,
+        targets: List[str],
+        modifiers: Dict[str, str],
+        _prelowered: bool = False
+    ):
         """
         Initialize parsed command.
 
@@ -15,10 +31,25 @@ class ParsedCommand:
             action: The main action/verb (e.g., "look", "take", "attack")
             targets: List of target objects (e.g., ["sword"], ["orc", "with", "bow"])
             modifiers: Dict of modifiers (e.g., {"direction": "north"})
+            _prelowered: Caller guarantees everything is already lowercase;
+                targets and modifiers are then used as-is rather than copied
         """
-        self.action = action.lower()
-        self.targets = [t.lower() for t in targets]
-        self.modifiers = {k.lower(): v.lower() for k, v in modifiers.items()}
+        if _prelowered:
+            self.action = action
+            self.targets = targets
+            self.modifiers = modifiers
+        else:
+            self.action = action.lower()
+            self.targets = [t.lower() for t in targets]
+            self.modifiers = {k.lower(): v.lower() for k, v in modifiers.items()}
+        self._target_phrase: Optional[str] = None
+
+    @property
+    def target_phrase(self) -> str:
+        """Targets joined into a single phrase (e.g., "old sword"), computed once."""
+        if self._target_phrase is None:
+            self._target_phrase = " ".join(self.targets)
+        return self._target_phrase
 
     def has_target(self, target: str) -> bool:
         """
@@ -59,7 +90,7 @@ class InputHandler:
     """Handles and parses user input."""
 
     # Common prepositions to filter out
-    PREPOSITIONS = {'with', 'using', 'to', 'from', 'at', 'in', 'on', 'by'}
+    PREPOSITIONS = frozenset({'with', 'using', 'to', 'from', 'at', 'in', 'on', 'by'})
 
     # Direction mappings
     DIRECTIONS = {
@@ -75,6 +106,19 @@ class InputHandler:
         'd': 'down', 'down': 'down'
     }
 
+    # Two-word verbs: first word -> {second word: action}. Checked before
+    # the single-word aliases so e.g. "up" in "pick up" isn't read as a direction
+    MULTIWORD_VERBS: Dict[str, Dict[str, str]] = {
+        'pick': {'up': 'take'},
+        'put': {'down': 'drop'},
+    }
+
+    # Directions and prepositions in one table: word -> (kind, canonical value)
+    _WORD_CLASS: Dict[str, Tuple[int, str]] = {
+        **{word: (_DIRECTION, direction) for word, direction in DIRECTIONS.items()},
+        **{word: (_PREPOSITION, word) for word in PREPOSITIONS},
+    }
+
     def __init__(self):
         """Initialize input handler."""
         self.command_aliases: Dict[str, str] = {
@@ -155,7 +199,14 @@ class InputHandler:
             return ParsedCommand(
                 action='move',
                 targets=[],
-                modifiers={'direction': self.DIRECTIONS[text]}
+                modifiers={'direction': self.DIRECTIONS[text]},
+                _prelowered=True
+            )
+
+        # Bare single words ("look", "i") need no splitting or target parsing
+        if text.isalpha():
+            return ParsedCommand(
+                self.command_aliases.get(text, text), [], {}, _prelowered=True
             )
 
         # Split into words
@@ -163,36 +214,56 @@ class InputHandler:
         if not words:
             return None
 
-        # First word is the action
+        # First word (or a known two-word verb) is the action
         action = words[0]
+        rest = 1
 
-        # Resolve aliases
-        action = self.command_aliases.get(action, action)
+        second_words = self.MULTIWORD_VERBS.get(action)
+        if second_words and len(words) > 1 and words[1] in second_words:
+            action = second_words[words[1]]
+            rest = 2
+        else:
+            # Resolve aliases
+            action = self.command_aliases.get(action, action)
 
         # Parse targets and modifiers
         targets = []
         modifiers = {}
 
-        i = 1
-        while i < len(words):
-            word = words[i]
+        word_class = self._WORD_CLASS
+        for word in words[rest:]:
+            kind_value = word_class.get(word)
+
+            # Unclassified words are targets; prepositions are skipped
+            if kind_value is None:
+                targets.append(word)
+            elif kind_value[0] == _DIRECTION:
+                modifiers['direction'] = kind_value[1]
 
-            # Check if it's a direction
-            if word in self.DIRECTIONS:
-                modifiers['direction'] = self.DIRECTIONS[word]
-                i += 1
-                continue
+        return ParsedCommand(action, targets, modifiers, _prelowered=True)
 
-            # Skip prepositions
-            if word in self.PREPOSITIONS:
-                i += 1
-                continue
+    def parse_combat(self, user_input: str) -> Optional[ParsedCommand]:
+        """
+        Parse combat input.
 
-            # Otherwise, it's a target
-            targets.append(word)
-            i += 1
+        Combat input is almost always "<verb>" or "<verb> <enemy number>",
+        so those forms are resolved through the aliases directly; anything
+        else goes through parse().
 
-        return ParsedCommand(action, targets, modifiers)
+        Args:
+            user_input: Raw user input string
+
+        Returns:
+            ParsedCommand object or None if invalid
+        """
+        words = user_input.lower().split()
+        if words and words[0] not in self.DIRECTIONS and (
+            len(words) == 1 or (len(words) == 2 and words[1].isdigit())
+        ):
+            action = self.command_aliases.get(words[0], words[0])
+            return ParsedCommand(action, words[1:], {}, _prelowered=True)
+
+        return self.parse(user_input)
 
     def normalize_direction(self, direction: str) -> Optional[str]:
         """
@@ -204,7 +275,8 @@ class InputHandler:
         Returns:
             Normalized direction or None
         """
-        return self.DIRECTIONS.get(direction.lower())
+        # Parsed input is already lowercase; skip the copy lower() would make
+        return self.DIRECTIONS.get(direction if direction.islower() else direction.lower())
 
     def is_movement_command(self, command: ParsedCommand) -> bool:
         """
@@ -223,7 +295,10 @@ class InputHandler:
 
     def extract_number(self, text: str) -> Optional[int]:
         """
-        Extract a number from text.
+        Extract the first number found anywhere in text.
+
+        Use extract_leading_number() instead when the number is known to
+        come first, e.g. "3 arrows".
 
         Args:
             text: Text containing a number
@@ -231,9 +306,25 @@ class InputHandler:
         Returns:
             Extracted number or None
         """
-        match = re.search(r'\d+', text)
+        match = _NUMBER_RE.search(text)
         return int(match.group()) if match else None
 
+    def extract_leading_number(self, text: str) -> Optional[int]:
+        """
+        Extract a number at the start of text (leading whitespace allowed).
+
+        Cheaper than extract_number() since the match is anchored and never
+        scans later positions; "take 5" returns None here.
+
+        Args:
+            text: Text starting with a number
+
+        Returns:
+            Extracted number or None
+        """
+        match = _LEADING_NUMBER_RE.match(text)
+        return int(match.group(1)) if match else None
+
     def split_compound_targets(self, targets: List[str]) -> List[str]:
         """
         Split compound targets like "wooden_sword" into ["wooden", "sword"].
@@ -244,21 +335,16 @@ class InputHandler:
         Returns:
             Expanded list of targets
         """
-        result = []
-        for target in targets:
-            if '_' in target:
-                result.extend(target.split('_'))
-            else:
-                result.append(target)
-        return result
-
-    def validate_command(self, command: ParsedCommand, valid_actions: List[str]) -> bool:
+        return [part for target in targets for part in target.split('_')]
+
+    def validate_command(self, command: ParsedCommand, valid_actions: Collection[str]) -> bool:
         """
-        Validate if command action is in list of valid actions.
+        Validate if command action is in a collection of valid actions.
 
         Args:
             command: Parsed command
-            valid_actions: List of valid action names
+            valid_actions: Valid action names; pass a set (built once by the
+                caller) for a hashed lookup instead of a list scan
 
         Returns:
             True if command is valid
@@ -3,7 +3,11 @@
 import os
 import sys
 from enum import Enum
-from typing import Optional, List
+from typing import Any, Callable, Optional, List, Sequence, Tuple, Union
+
+
+# One row of a stats listing; None renders as a blank separator line
+StatRow = Optional[Tuple[str, Any]]
 
 
 class Color(Enum):
@@ -38,19 +42,66 @@ class Style(Enum):
     RESET = "\033[0m"
 
 
+# Escape prefix for every (color, style) pair, so colorize() skips Enum .value lookups
+_ANSI_PREFIXES = {
+    (color, style): color.value + (style.value if style else "")
+    for color in Color
+    for style in (None, *Style)
+}
+_ANSI_RESET = Color.RESET.value
+
+
+def _uncolored(text: str, color: Color, style: Optional[Style] = None) -> str:
+    """colorize() stand-in bound on formatters with colors off."""
+    return text
+
+
 class OutputFormatter:
     """Handles text output with formatting and colors."""
 
-    def __init__(self, use_colors: bool = True, clear_screen: bool = True):
+    def __init__(self, use_colors: bool = True, clear_screen: bool = True, line_editing: bool = True):
         """
         Initialize output formatter.
 
         Args:
             use_colors: Whether to use ANSI colors
             clear_screen: Whether to support clear screen functionality
+            line_editing: Whether terminal prompts go through input() for line
+                editing; when False, prompts always use the plain readline path
         """
+        self._color_listeners: List[Callable[[], None]] = []
         self.use_colors = use_colors and self._supports_color()
         self.clear_screen_enabled = clear_screen
+        self.line_editing = line_editing
+
+    @property
+    def use_colors(self) -> bool:
+        """Whether ANSI colors are emitted."""
+        return self._use_colors
+
+    @use_colors.setter
+    def use_colors(self, value: bool) -> None:
+        if value == self.__dict__.get('_use_colors'):
+            return
+        self._use_colors = value
+        # With colors off, bind colorize to a pass-through so calls skip the check
+        if value:
+            self.__dict__.pop('colorize', None)
+        else:
+            self.colorize = _uncolored
+        for listener in self._color_listeners:
+            listener()
+
+    def add_color_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Register a callback to run whenever use_colors changes.
+
+        Lets callers that cache formatted text re-render it.
+
+        Args:
+            listener: Callable taking no arguments
+        """
+        self._color_listeners.append(listener)
 
     def _supports_color(self) -> bool:
         """
@@ -77,6 +128,9 @@ class OutputFormatter:
         """
         Apply color and style to text.
 
+        Only reached with colors on; the use_colors setter binds a
+        pass-through in its place otherwise.
+
         Args:
             text: Text to colorize
             color: Color to apply
@@ -85,15 +139,16 @@ class OutputFormatter:
         Returns:
             Formatted text string
         """
-        if not self.use_colors:
-            return text
+        return f"{_ANSI_PREFIXES[color, style]}{text}{_ANSI_RESET}"
 
-        result = color.value
-        if style:
-            result += style.value
-        result += text + Color.RESET.value
+    def write(self, text: str) -> None:
+        """
+        Write pre-rendered text to stdout in a single call.
 
-        return result
+        Args:
+            text: Text to write (including any newlines)
+        """
+        sys.stdout.write(text)
 
     def print_colored(self, text: str, color: Color, style: Optional[Style] = None) -> None:
         """
@@ -106,6 +161,21 @@ class OutputFormatter:
         """
         print(self.colorize(text, color, style))
 
+    def format_title(self, text: str) -> str:
+        """
+        Render a title (centered, styled).
+
+        Args:
+            text: Title text
+
+        Returns:
+            Rendered title, ending with a blank line
+        """
+        width = 60
+        border = self.colorize("=" * width, Color.CYAN, Style.BOLD)
+        centered = self.colorize(text.center(width), Color.BRIGHT_CYAN, Style.BOLD)
+        return f"{border}\n{centered}\n{border}\n\n"
+
     def print_title(self, text: str) -> None:
         """
         Print a title (centered, styled).
@@ -113,14 +183,24 @@ class OutputFormatter:
         Args:
             text: Title text
         """
-        width = 60
-        border = "=" * width
+        self.write(self.format_title(text))
 
-        self.print_colored(border, Color.CYAN, Style.BOLD)
-        centered = text.center(width)
-        self.print_colored(centered, Color.BRIGHT_CYAN, Style.BOLD)
-        self.print_colored(border, Color.CYAN, Style.BOLD)
-        print()
+    def format_section(self, text: str) -> str:
+        """
+        Render a section header.
+
+        Args:
+            text: Section text
+
+        Returns:
+            Rendered header, ending with a blank line
+        """
+        return (
+            "\n"
+            f"{self.colorize(text, Color.YELLOW, Style.BOLD)}\n"
+            f"{self.colorize('-' * len(text), Color.YELLOW)}\n"
+            "\n"
+        )
 
     def print_section(self, text: str) -> None:
         """
@@ -129,10 +209,7 @@ class OutputFormatter:
         Args:
             text: Section text
         """
-        print()
-        self.print_colored(text, Color.YELLOW, Style.BOLD)
-        self.print_colored("-" * len(text), Color.YELLOW)
-        print()
+        self.write(self.format_section(text))
 
     def print_error(self, text: str) -> None:
         """
@@ -161,6 +238,18 @@ class OutputFormatter:
         """
         self.print_colored(f"⚠ {text}", Color.YELLOW)
 
+    def format_info(self, text: str) -> str:
+        """
+        Render an info message.
+
+        Args:
+            text: Info text
+
+        Returns:
+            Rendered message line
+        """
+        return f"{self.colorize(f'ℹ {text}', Color.CYAN)}\n"
+
     def print_info(self, text: str) -> None:
         """
         Print an info message.
@@ -168,7 +257,23 @@ class OutputFormatter:
         Args:
             text: Info text
         """
-        self.print_colored(f"ℹ {text}", Color.CYAN)
+        self.write(self.format_info(text))
+
+    def format_story(self, text: str, indent: int = 0) -> str:
+        """
+        Render story text (narrative descriptions).
+
+        Args:
+            text: Story text
+            indent: Number of spaces to indent
+
+        Returns:
+            Rendered text, skipping blank lines and ending with a blank line
+        """
+        indentation = " " * indent
+        lines = [f"{indentation}{line}\n" for line in text.split('\n') if line.strip()]
+        lines.append("\n")
+        return "".join(lines)
 
     def print_story(self, text: str, indent: int = 0) -> None:
         """
@@ -178,11 +283,7 @@ class OutputFormatter:
             text: Story text
             indent: Number of spaces to indent
         """
-        indentation = " " * indent
-        for line in text.split('\n'):
-            if line.strip():
-                print(f"{indentation}{line}")
-        print()
+        self.write(self.format_story(text, indent))
 
     def print_dialogue(self, speaker: str, text: str) -> None:
         """
@@ -196,23 +297,39 @@ class OutputFormatter:
         print(f'  "{text}"')
         print()
 
-    def print_menu(self, title: str, options: List[str], numbered: bool = True) -> None:
+    def format_menu(self, title: str, options: Sequence[str], numbered: bool = True) -> str:
         """
-        Print a menu with options.
+        Render a menu with options.
 
         Args:
             title: Menu title
-            options: List of menu options
+            options: Menu options
             numbered: Whether to number the options
+
+        Returns:
+            Rendered menu
         """
-        self.print_section(title)
+        lines = [self.format_section(title)]
 
         for i, option in enumerate(options, 1):
             if numbered:
-                print(f"  {i}. {option}")
+                lines.append(f"  {i}. {option}\n")
             else:
-                print(f"  • {option}")
-        print()
+                lines.append(f"  • {option}\n")
+        lines.append("\n")
+
+        return "".join(lines)
+
+    def print_menu(self, title: str, options: Sequence[str], numbered: bool = True) -> None:
+        """
+        Print a menu with options.
+
+        Args:
+            title: Menu title
+            options: Menu options
+            numbered: Whether to number the options
+        """
+        self.write(self.format_menu(title, options, numbered))
 
     def print_box(self, text: str, width: int = 60) -> None:
         """
@@ -222,38 +339,70 @@ class OutputFormatter:
             text: Text to box
             width: Box width
         """
-        border = "+" + "-" * (width - 2) + "+"
+        border = "+" + "-" * (width - 2) + "+\n"
 
-        print(border)
+        inner = width - 4
+        lines = [border]
         for line in text.split('\n'):
-            padding = width - len(line) - 4
-            print(f"| {line}{' ' * padding} |")
-        print(border)
+            lines.append(f"| {line.ljust(inner)} |\n")
+        lines.append(border)
+
+        self.write("".join(lines))
 
-    def print_stats(self, stats: dict) -> None:
+    def format_stats(self, stats: Union[dict, Sequence[StatRow]]) -> str:
         """
-        Print character stats in a formatted way.
+        Render character stats as aligned "label: value" lines.
 
         Args:
-            stats: Dictionary of stat name to value
+            stats: Dict of stat name to value, or a sequence of
+                (label, value) pairs where None marks a blank separator line.
+                Labels are aligned within each group between separators.
+
+        Returns:
+            Rendered stats text
+        """
+        rows = stats.items() if isinstance(stats, dict) else stats
+
+        groups: List[List[Tuple[str, Any]]] = [[]]
+        for row in rows:
+            if row is None:
+                groups.append([])
+            else:
+                groups[-1].append(row)
+
+        parts = []
+        append = parts.append
+        colorize = self.colorize
+        for i, group in enumerate(groups):
+            if i:
+                append("\n")
+            width = max((len(label) for label, _ in group), default=0)
+            for label, value in group:
+                append(f"{colorize(f'  {label.ljust(width)}: ', Color.CYAN)}{value}\n")
+
+        return "".join(parts)
+
+    def print_stats(self, stats: Union[dict, Sequence[StatRow]]) -> None:
         """
-        max_key_length = max(len(k) for k in stats.keys()) if stats else 0
+        Print character stats in a formatted way.
 
-        for key, value in stats.items():
-            key_padded = key.ljust(max_key_length)
-            self.print_colored(f"  {key_padded}: ", Color.CYAN)
-            print(f"{value}")
+        Args:
+            stats: Dict of stat name to value, or a sequence of
+                (label, value) pairs with None as a blank separator line
+        """
+        self.write(self.format_stats(stats))
 
     def clear(self) -> None:
         """Clear the screen."""
         if not self.clear_screen_enabled:
             return
 
-        # Clear command depends on OS
+        # Windows consoles may lack ANSI support; elsewhere skip spawning a shell
         if os.name == 'nt':  # Windows
             os.system('cls')
-        else:  # Unix/Linux/Mac
-            os.system('clear')
+        else:  # Unix/Linux/Mac: home the cursor and erase the screen
+            sys.stdout.write("\033[H\033[2J")
+            sys.stdout.flush()
 
     def prompt(self, text: str, color: Color = Color.BRIGHT_WHITE) -> str:
         """
@@ -267,7 +416,18 @@ class OutputFormatter:
             User input string
         """
         prompt_text = self.colorize(text, color)
-        return input(prompt_text).strip()
+        stdin = sys.stdin
+        if self.line_editing and stdin.isatty():
+            return input(prompt_text).strip()
+
+        # Piped/scripted input (or editing disabled): one write, one flush, one readline
+        stdout = sys.stdout
+        stdout.write(prompt_text)
+        stdout.flush()
+        line = stdin.readline()
+        if not line:
+            raise EOFError
+        return line.strip()
 
     def confirm(self, text: str) -> bool:
         """
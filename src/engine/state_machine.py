@@ -1,7 +1,7 @@
 """State machine for managing game state transitions."""
 
 from enum import Enum, auto
-from typing import Optional, Dict, Callable, Any
+from typing import Optional, Dict, Callable, Any, FrozenSet
 
 
 class GameState(Enum):
@@ -22,6 +22,71 @@ class GameState(Enum):
 class StateMachine:
     """Manages game state transitions with validation."""
 
+    # Valid transitions out of each state, built once
+    _VALID_TRANSITIONS: Dict[GameState, FrozenSet[GameState]] = {
+        GameState.MAIN_MENU: frozenset({
+            GameState.LOGIN,
+            GameState.REGISTER,
+            GameState.CHARACTER_SELECT,
+            GameState.QUIT
+        }),
+        GameState.LOGIN: frozenset({
+            GameState.MAIN_MENU,
+            GameState.CHARACTER_SELECT
+        }),
+        GameState.REGISTER: frozenset({
+            GameState.MAIN_MENU,
+            GameState.CHARACTER_SELECT,
+            GameState.LOGIN
+        }),
+        GameState.CHARACTER_SELECT: frozenset({
+            GameState.MAIN_MENU,
+            GameState.PLAYING
+        }),
+        GameState.PLAYING: frozenset({
+            GameState.COMBAT,
+            GameState.DIALOGUE,
+            GameState.INVENTORY,
+            GameState.STATS,
+            GameState.PAUSE,
+            GameState.MAIN_MENU,
+            GameState.QUIT
+        }),
+        GameState.COMBAT: frozenset({
+            GameState.PLAYING,
+            GameState.INVENTORY,
+            GameState.QUIT
+        }),
+        GameState.DIALOGUE: frozenset({
+            GameState.PLAYING,
+            GameState.QUIT
+        }),
+        GameState.INVENTORY: frozenset({
+            GameState.PLAYING,
+            GameState.COMBAT,
+            GameState.QUIT
+        }),
+        GameState.STATS: frozenset({
+            GameState.PLAYING,
+            GameState.QUIT
+        }),
+        GameState.PAUSE: frozenset({
+            GameState.PLAYING,
+            GameState.MAIN_MENU,
+            GameState.QUIT
+        }),
+        GameState.QUIT: frozenset()  # No transitions from QUIT
+    }
+
+    # States that count as being in gameplay
+    _GAMEPLAY_STATES: FrozenSet[GameState] = frozenset({
+        GameState.PLAYING,
+        GameState.COMBAT,
+        GameState.DIALOGUE,
+        GameState.INVENTORY,
+        GameState.STATS
+    })
+
     def __init__(self, initial_state: GameState = GameState.MAIN_MENU):
         """
         Initialize state machine.
@@ -69,67 +134,11 @@ class StateMachine:
         Returns:
             True if transition is allowed
         """
-        # Define valid transitions
-        valid_transitions = {
-            GameState.MAIN_MENU: {
-                GameState.LOGIN,
-                GameState.REGISTER,
-                GameState.CHARACTER_SELECT,
-                GameState.QUIT
-            },
-            GameState.LOGIN: {
-                GameState.MAIN_MENU,
-                GameState.CHARACTER_SELECT
-            },
-            GameState.REGISTER: {
-                GameState.MAIN_MENU,
-                GameState.CHARACTER_SELECT,
-                GameState.LOGIN
-            },
-            GameState.CHARACTER_SELECT: {
-                GameState.MAIN_MENU,
-                GameState.PLAYING
-            },
-            GameState.PLAYING: {
-                GameState.COMBAT,
-                GameState.DIALOGUE,
-                GameState.INVENTORY,
-                GameState.STATS,
-                GameState.PAUSE,
-                GameState.MAIN_MENU,
-                GameState.QUIT
-            },
-            GameState.COMBAT: {
-                GameState.PLAYING,
-                GameState.INVENTORY,
-                GameState.QUIT
-            },
-            GameState.DIALOGUE: {
-                GameState.PLAYING,
-                GameState.QUIT
-            },
-            GameState.INVENTORY: {
-                GameState.PLAYING,
-                GameState.COMBAT,
-                GameState.QUIT
-            },
-            GameState.STATS: {
-                GameState.PLAYING,
-                GameState.QUIT
-            },
-            GameState.PAUSE: {
-                GameState.PLAYING,
-                GameState.MAIN_MENU,
-                GameState.QUIT
-            },
-            GameState.QUIT: set()  # No transitions from QUIT
-        }
-
         # Allow self-transitions (staying in same state)
         if from_state == to_state:
             return True
 
-        return to_state in valid_transitions.get(from_state, set())
+        return to_state in self._VALID_TRANSITIONS.get(from_state, frozenset())
 
     def register_callback(self, state: GameState, callback: Callable) -> None:
         """
@@ -183,13 +192,7 @@ class StateMachine:
         Returns:
             True if in PLAYING, COMBAT, DIALOGUE, INVENTORY, or STATS
         """
-        return self.current_state in {
-            GameState.PLAYING,
-            GameState.COMBAT,
-            GameState.DIALOGUE,
-            GameState.INVENTORY,
-            GameState.STATS
-        }
+        return self.current_state in self._GAMEPLAY_STATES
 
     def reset(self) -> None:
         """Reset state machine to initial state."""
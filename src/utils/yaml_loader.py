@@ -0,0 +1,16 @@
+"""YAML loader selection shared by config and data loading."""
+
+import logging
+
+import yaml
+
+# Safe loader for all YAML files; the libyaml one is much faster when built
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
+logger = logging.getLogger(__name__)
+
+if YamlLoader is yaml.SafeLoader:
+    logger.debug("libyaml not available, using pure-Python YAML parser")
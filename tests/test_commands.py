@@ -0,0 +1,61 @@
+"""Tests for the command registry."""
+
+from src.engine.commands import CommandCategory, CommandDefinition, CommandRegistry
+
+
+def test_find_command_in_ignores_pronoun_i():
+    """Test that the pronoun "I" is not read as the inventory alias."""
+    registry = CommandRegistry()
+    assert registry.find_command_in("I want to run away now").name == "flee"
+    assert registry.find_command_in("I'd like to attack").name == "attack"
+
+
+def test_find_command_in_prefers_multiword_alias():
+    """Test that "run away" wins over its "run" prefix."""
+    registry = CommandRegistry()
+    assert registry.find_command_in("run away from the troll").name == "flee"
+    assert registry.find_command_in("run to the castle").name == "move"
+
+
+def test_find_command_in_no_match():
+    """Test that text without any command returns None."""
+    registry = CommandRegistry()
+    assert registry.find_command_in("a quiet morning in Crydee") is None
+
+
+def test_complete_matches_names_and_aliases():
+    """Test completion through names, aliases and multi-word aliases."""
+    registry = CommandRegistry()
+    names = [cmd.name for cmd in registry.complete("r")]
+    assert names == ["flee", "move", "rest", "unequip"]
+
+
+def test_complete_empty_prefix_returns_all_commands():
+    """Test that an empty prefix returns every command once."""
+    registry = CommandRegistry()
+    names = [cmd.name for cmd in registry.complete("")]
+    assert names == sorted(registry.get_command_names())
+
+
+def test_complete_unknown_prefix():
+    """Test that an unknown prefix returns no commands."""
+    registry = CommandRegistry()
+    assert registry.complete("xyz") == []
+
+
+def test_complete_after_register():
+    """Test that the completion trie is rebuilt after register()."""
+    registry = CommandRegistry()
+    assert registry.complete("med") == []
+
+    registry.register(CommandDefinition(
+        name="meditate",
+        description="Meditate to recover mana",
+        category=CommandCategory.INTERACTION,
+        aliases=("focus",),
+        usage="meditate",
+        examples=("meditate",)
+    ))
+
+    assert [cmd.name for cmd in registry.complete("med")] == ["meditate"]
+    assert [cmd.name for cmd in registry.complete("fo")] == ["meditate"]
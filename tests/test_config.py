@@ -25,3 +25,10 @@ def test_config_properties():
     config = Config(get_default_config())
     assert config.debug is True
     assert config.game_title == "The Magician"
+
+
+def test_config_get_section():
+    """Test Config.get returns whole sections and falls back on leaves."""
+    config = Config({"game": {"title": "Test", "nested": {"value": 42}}})
+    assert config.get("game.nested") == {"value": 42}
+    assert config.get("game.title.length", "default") == "default"
@@ -0,0 +1,49 @@
+"""Tests for enemy AI helpers."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from src.combat.enemy import AliasTable
+
+
+def test_alias_table_frequencies():
+    """Test that samples follow the weights and zero weights never come up."""
+    random.seed(1234)
+    table = AliasTable((0.1, 0.2, 0.7, 0))
+
+    draws = 100_000
+    counts = Counter(table.sample() for _ in range(draws))
+
+    assert counts[3] == 0
+    assert counts[0] / draws == pytest.approx(0.1, abs=0.01)
+    assert counts[1] / draws == pytest.approx(0.2, abs=0.01)
+    assert counts[2] / draws == pytest.approx(0.7, abs=0.01)
+
+
+def test_alias_table_full_buckets():
+    """Test that equal weights leave every bucket full."""
+    table = AliasTable((1, 1, 1))
+    assert table.prob == [1.0, 1.0, 1.0]
+    assert table.alias == [0, 1, 2]
+
+
+def test_alias_table_rounding_leftovers():
+    """Test that a bucket left just under 1.0 by rounding error is filled."""
+    # Pairing leaves index 2 at 0.9999999999999998 with no large bucket left
+    table = AliasTable((0.1, 0.2, 0.7))
+    assert table.prob[2] == 1.0
+    assert table.alias[2] == 2
+
+
+def test_alias_table_rejects_empty_weights():
+    """Test that an empty weight list is rejected."""
+    with pytest.raises(ValueError):
+        AliasTable(())
+
+
+def test_alias_table_rejects_all_zero_weights():
+    """Test that all-zero weights are rejected."""
+    with pytest.raises(ValueError):
+        AliasTable((0, 0, 0))
@@ -0,0 +1,85 @@
+"""Tests for game loop command handling."""
+
+import io
+
+import pytest
+
+from src.character import CoreAttributes, PlayerCharacter
+from src.config.settings import Config, get_default_config
+from src.engine.game_loop import GameLoop, _COURTYARD_LOOK_TEXT
+from src.engine.state_machine import GameState
+
+
+@pytest.fixture
+def game(tmp_path, monkeypatch):
+    """Game loop with a character standing in the courtyard."""
+    monkeypatch.chdir(tmp_path)
+    loop = GameLoop(Config(get_default_config()))
+    loop.output.use_colors = False
+    loop.output.clear_screen_enabled = False
+    loop.player = PlayerCharacter(
+        username="tester",
+        character_name="tomas",
+        path="tomas",
+        attributes=CoreAttributes(10, 10, 10, 10, 10, 10)
+    )
+    loop.state_machine.current_state = GameState.PLAYING
+    return loop
+
+
+def feed(monkeypatch, text):
+    """Script stdin with the given lines."""
+    monkeypatch.setattr("sys.stdin", io.StringIO(text))
+
+
+def test_chained_commands_all_run(game, monkeypatch, capsys):
+    """Test that commands separated by ';' run in order."""
+    feed(monkeypatch, "look;l\n")
+    game._handle_playing()
+
+    assert capsys.readouterr().out.count(_COURTYARD_LOOK_TEXT) == 2
+    assert game.state_machine.current_state == GameState.PLAYING
+
+
+def test_chained_commands_stop_after_quit(game, monkeypatch, capsys):
+    """Test that commands after a state change wait in the queue."""
+    feed(monkeypatch, "quit; look\n")
+    game._handle_playing()
+
+    assert game.state_machine.current_state == GameState.QUIT
+    assert _COURTYARD_LOOK_TEXT not in capsys.readouterr().out
+
+
+def test_queued_commands_resume_after_inventory(game, monkeypatch, capsys):
+    """Test that leftover commands run after returning from the inventory."""
+    feed(monkeypatch, "inventory; look\n\n")
+
+    game._handle_playing()
+    assert game.state_machine.current_state == GameState.INVENTORY
+    assert _COURTYARD_LOOK_TEXT not in capsys.readouterr().out
+
+    game._handle_inventory()
+    assert game.state_machine.current_state == GameState.PLAYING
+
+    game._handle_playing()
+    assert _COURTYARD_LOOK_TEXT in capsys.readouterr().out
+
+
+def test_help_mentions_command_chaining(game, monkeypatch, capsys):
+    """Test that the full help listing documents ';' chaining."""
+    feed(monkeypatch, "help\n\n")
+    game._handle_playing()
+
+    assert "Chain several commands with ';'" in capsys.readouterr().out
+
+
+def test_static_text_follows_color_setting(game):
+    """Test that pre-rendered menus are re-rendered when colors are toggled."""
+    game.current_user = "tester"
+    game.output.use_colors = True
+    assert "\033[" in game._main_menu_text
+    assert "\033[" in game._user_menu_text()
+
+    game.output.use_colors = False
+    assert "\033[" not in game._main_menu_text
+    assert "\033[" not in game._user_menu_text()
@@ -0,0 +1,75 @@
+"""Tests for input parsing."""
+
+from src.engine.input_handler import InputHandler
+
+
+def test_parse_pick_up():
+    """Test that "pick up" is one verb, not a direction modifier."""
+    command = InputHandler().parse("pick up sword")
+    assert command.action == "take"
+    assert command.targets == ["sword"]
+    assert command.modifiers == {}
+
+
+def test_parse_put_down():
+    """Test that "put down" resolves to drop."""
+    command = InputHandler().parse("put down sword")
+    assert command.action == "drop"
+    assert command.targets == ["sword"]
+    assert command.modifiers == {}
+
+
+def test_parse_single_word_alias_with_target():
+    """Test that "pick" alone still resolves through the aliases."""
+    command = InputHandler().parse("pick sword")
+    assert command.action == "take"
+    assert command.targets == ["sword"]
+
+
+def test_parse_direction_modifier():
+    """Test that a direction after a verb becomes a modifier."""
+    command = InputHandler().parse("go up")
+    assert command.action == "move"
+    assert command.targets == []
+    assert command.get_modifier("direction") == "up"
+
+
+def test_parse_prepositions_and_direction():
+    """Test that prepositions are skipped and abbreviations normalized."""
+    command = InputHandler().parse("look at old sword with n")
+    assert command.action == "look"
+    assert command.targets == ["old", "sword"]
+    assert command.modifiers == {"direction": "north"}
+
+
+def test_parse_combat_verb_and_number():
+    """Test the combat shortcut for "<verb> <number>" with aliases."""
+    handler = InputHandler()
+
+    command = handler.parse_combat("Hit 2")
+    assert command.action == "attack"
+    assert command.targets == ["2"]
+
+    assert handler.parse_combat("defend").action == "defend"
+    assert handler.parse_combat("   ") is None
+
+
+def test_parse_combat_falls_back_to_parse():
+    """Test that other combat input gets the full parse."""
+    handler = InputHandler()
+
+    command = handler.parse_combat("n")
+    assert command.action == "move"
+    assert command.get_modifier("direction") == "north"
+
+    command = handler.parse_combat("attack the orc with bow")
+    assert command.action == "attack"
+    assert command.targets == ["the", "orc", "bow"]
+
+
+def test_extract_leading_number():
+    """Test that only a number at the start of the text is extracted."""
+    handler = InputHandler()
+    assert handler.extract_leading_number("3 arrows") == 3
+    assert handler.extract_leading_number("  7") == 7
+    assert handler.extract_leading_number("take 5") is None